@@ -11,12 +11,85 @@ Phase 2 Day 5 deliverable for IMPLEMENTATION_PLAN.md
 
 import json
 import logging
+import math
 import re
-from typing import Dict, List, Tuple, Optional, Any, Union
+from dataclasses import dataclass
+from typing import Dict, List, Tuple, Optional, Any, Union, FrozenSet, Iterable, Set
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Dimension phrases normalized at the end of German translation
+_METER_X_RE = re.compile(r'(\d+)\s*x\s*(\d+)\s*meter')
+_METER_RE = re.compile(r'(\d+)\s*meter')
+
+# Special requirement keywords, one named group per requirement tag
+_SPECIAL_RE = re.compile(
+    r'(?=(?P<accessibility_compliant>accessible|wheelchair|disability)'
+    r'|(?P<professional_grade>professional|chef|commercial)'
+    r'|(?P<entertainment_focused>entertaining|party|guests))'
+)
+_SPECIAL_REQUIREMENTS = ("accessibility_compliant", "professional_grade", "entertainment_focused")
+
+# Template names per absolute templates directory, with the directory mtime they were read at
+_TEMPLATE_NAMES_CACHE: Dict[str, Tuple[int, Tuple[str, ...]]] = {}
+
+# Maximum number of distinct request texts kept by extract_requirements_from_text
+_EXTRACT_CACHE_SIZE = 256
+
+# Common German kitchen phrases
+_GERMAN_PHRASES: Tuple[Tuple[str, str], ...] = (
+    ("küche mit insel", "kitchen with island"),
+    ("moderne küche", "modern kitchen"),
+    ("kleine küche", "small kitchen"),
+    ("große küche", "large kitchen"),
+    ("offene küche", "open kitchen"),
+    ("l-förmige küche", "l-shaped kitchen"),
+    ("u-förmige küche", "u-shaped kitchen")
+)
+
+# Transliterates umlauts and ß so "küche" and "kueche" look up the same term
+_GERMAN_NORMALIZE_TABLE = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+
+# Transliterated spellings in a term and the pattern accepting either spelling
+_GERMAN_SPELLING_RE = re.compile(r'ae|oe|ue|ss')
+_GERMAN_SPELLINGS = {"ae": "(?:ae|ä)", "oe": "(?:oe|ö)", "ue": "(?:ue|ü)", "ss": "(?:ss|ß)"}
+
+# Dimension patterns tried in order, e.g. "4x3 meters", "4 by 3 m", "4000x3000"
+_DIM_PATTERNS = (
+    re.compile(r'(\d+(?:\.\d+)?)\s*x\s*(\d+(?:\.\d+)?)\s*m(?:eters?)?', re.IGNORECASE),
+    re.compile(r'(\d+)\s*by\s*(\d+)\s*m(?:eters?)?', re.IGNORECASE),
+    re.compile(r'(\d{4,})\s*x\s*(\d{4,})', re.IGNORECASE)  # For mm values
+)
+
+# All dimension patterns in one alternation, so text without dimensions is scanned once
+_DIMS_RE = re.compile(
+    r'(?P<a>\d+(?:\.\d+)?)\s*x\s*(?P<b>\d+(?:\.\d+)?)\s*m(?:eters?)?'
+    r'|(?P<c>\d+)\s*by\s*(?P<d>\d+)\s*m(?:eters?)?'
+    r'|(?P<e>\d{4,})\s*x\s*(?P<f>\d{4,})',
+    re.IGNORECASE
+)
+
+# Vocabulary sections whose keywords are matched against request text
+_KEYWORD_KINDS = ("styles", "appliances", "layouts", "budget_indicators")
+
+@dataclass(frozen=True, slots=True)
+class TemplateFeatures:
+    """Normalized template attributes used for requirement scoring."""
+    width: Optional[float]
+    height: Optional[float]
+    layout: str
+    style: str
+    appliances: FrozenSet[str]
+
 class AgentZeroHelpers:
     """
     Helper functions for Agent Zero kitchen design integration.
@@ -36,8 +109,15 @@ class AgentZeroHelpers:
         """
         self.vocabulary_path = vocabulary_path
         self.templates_dir = Path(templates_dir)
-        self.vocabulary = self._load_vocabulary()
+        self.vocabulary = self._lowercase_keywords(self._load_vocabulary())
+        self._translation_mapping, self._translation_re = self._compile_translations()
+        self._keyword_hits, self._keyword_re = self._compile_keyword_matcher()
+        self._extract_cache: Dict[str, Dict[str, Any]] = {}
+        self._template_cache: Dict[str, Optional[Dict[str, Any]]] = {}
         self.available_templates = self._load_available_templates()
+        self._templates_set = frozenset(self.available_templates)
+        self._features = self._load_template_features()
+        self._tpl_w, self._tpl_h, self._tpl_has_dims = self._build_dimension_arrays()
         logger.info("Agent Zero helpers initialized")
     
     def select_best_template(self, requirements: Dict[str, Any]) -> str:
@@ -55,31 +135,30 @@ class AgentZeroHelpers:
         Returns:
             Name of the best matching template
         """
-        logger.info(f"Selecting template for requirements: {requirements}")
+        logger.info("Selecting template for requirements: %s", requirements)
         
         # Extract key requirements
         dimensions = requirements.get("dimensions", [4000, 3000])
         style = requirements.get("style", "modern").lower()
-        appliances = requirements.get("appliances", [])
+        required_appliances = frozenset(requirements.get("appliances", []))
         layout_pref = requirements.get("layout_preference", "").lower()
         budget = requirements.get("budget", "mid_range").lower()
         
         # Calculate room area
         room_area = dimensions[0] * dimensions[1] if len(dimensions) >= 2 else 12000000  # Default 4x3m
         
-        # Score each available template
-        template_scores = {}
-        for template_name in self.available_templates:
-            score = self._score_template_match(template_name, dimensions, room_area, 
-                                             style, appliances, layout_pref, budget)
-            template_scores[template_name] = score
-            logger.debug(f"Template {template_name} scored: {score:.2f}")
+        # Score all available templates at once
+        scores = self._score_templates(dimensions, room_area, style, required_appliances, layout_pref, budget)
+        if logger.isEnabledFor(logging.DEBUG):
+            for template_name, score in zip(self.available_templates, scores):
+                logger.debug("Template %s scored: %.2f", template_name, score)
         
         # Select best match
-        best_template = max(template_scores, key=template_scores.get)
-        best_score = template_scores[best_template]
+        best_index = int(np.argmax(scores))
+        best_template = self.available_templates[best_index]
+        best_score = scores[best_index]
         
-        logger.info(f"Selected template: {best_template} (score: {best_score:.2f})")
+        logger.info("Selected template: %s (score: %.2f)", best_template, best_score)
         
         return best_template
     
@@ -93,41 +172,25 @@ class AgentZeroHelpers:
         Returns:
             Text with German terms translated to English
         """
-        logger.info(f"Translating German terms in: {text}")
+        logger.info("Translating German terms in: %s", text)
         
         if not text:
             return text
         
         translated_text = text.lower()
         
-        # Get German to English mappings from vocabulary
-        german_mappings = self.vocabulary.get("german_to_english", {})
-        
-        # Apply direct translations
-        for german_term, english_term in german_mappings.items():
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(german_term) + r'\b'
-            translated_text = re.sub(pattern, english_term, translated_text, flags=re.IGNORECASE)
-        
-        # Handle common German kitchen phrases
-        phrase_mappings = {
-            "küche mit insel": "kitchen with island",
-            "moderne küche": "modern kitchen", 
-            "kleine küche": "small kitchen",
-            "große küche": "large kitchen",
-            "offene küche": "open kitchen",
-            "l-förmige küche": "l-shaped kitchen",
-            "u-förmige küche": "u-shaped kitchen"
-        }
-        
-        for german_phrase, english_phrase in phrase_mappings.items():
-            translated_text = translated_text.replace(german_phrase, english_phrase)
+        # Apply phrase and direct term translations in a single pass over the text;
+        # only the lookup key is transliterated, untranslated words keep their umlauts
+        translated_text = self._translation_re.sub(
+            lambda m: self._translation_mapping[m.group(0).translate(_GERMAN_NORMALIZE_TABLE)],
+            translated_text)
         
         # Handle dimension translations
-        translated_text = re.sub(r'(\d+)\s*x\s*(\d+)\s*meter', r'\1x\2 meters', translated_text)
-        translated_text = re.sub(r'(\d+)\s*meter', r'\1 meters', translated_text)
+        if "meter" in translated_text:
+            translated_text = _METER_X_RE.sub(r'\1x\2 meters', translated_text)
+            translated_text = _METER_RE.sub(r'\1 meters', translated_text)
         
-        logger.info(f"Translation result: {translated_text}")
+        logger.info("Translation result: %s", translated_text)
         return translated_text
     
     def validate_generated_json(self, json_data: Dict[str, Any]) -> Tuple[bool, List[str], Dict[str, Any]]:
@@ -154,7 +217,7 @@ class AgentZeroHelpers:
         # Validate template_name
         if "template_name" in json_data:
             template_name = json_data["template_name"]
-            if template_name not in self.available_templates:
+            if not isinstance(template_name, str) or template_name not in self._templates_set:
                 errors.append(f"Unknown template: {template_name}")
                 suggestions["template_name"] = f"Available templates: {list(self.available_templates)}"
         
@@ -174,7 +237,7 @@ class AgentZeroHelpers:
         
         is_valid = len(errors) == 0
         
-        logger.info(f"Validation result: {'Valid' if is_valid else 'Invalid'} ({len(errors)} errors)")
+        logger.info("Validation result: %s (%d errors)", "Valid" if is_valid else "Invalid", len(errors))
         
         return is_valid, errors, suggestions
     
@@ -188,22 +251,20 @@ class AgentZeroHelpers:
         Returns:
             Dictionary with extracted requirements
         """
-        logger.info(f"Extracting requirements from: {text}")
-        
-        # Translate German terms first
-        translated_text = self.translate_german_terms(text)
-        
-        requirements = {
-            "dimensions": self._extract_dimensions(translated_text),
-            "style": self._extract_style(translated_text),
-            "appliances": self._extract_appliances(translated_text),
-            "layout_preference": self._extract_layout(translated_text),
-            "budget": self._extract_budget(translated_text),
-            "special_requirements": self._extract_special_requirements(translated_text)
-        }
-        
-        logger.info(f"Extracted requirements: {requirements}")
-        return requirements
+        logger.info("Extracting requirements from: %s", text)
+        
+        requirements = self._extract_cache.get(text)
+        if requirements is None:
+            requirements = self._extract_requirements(text)
+            if len(self._extract_cache) >= _EXTRACT_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._extract_cache[next(iter(self._extract_cache))]
+            self._extract_cache[text] = requirements
+        
+        logger.info("Extracted requirements: %s", requirements)
+        # Copy lists so callers cannot modify the cached result
+        return {key: list(value) if isinstance(value, list) else value
+                for key, value in requirements.items()}
     
     def suggest_template_alternatives(self, template_name: str, 
                                     requirements: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -217,11 +278,18 @@ class AgentZeroHelpers:
         Returns:
             List of alternative templates with reasons
         """
-        logger.info(f"Finding alternatives to template: {template_name}")
+        logger.info("Finding alternatives to template: %s", template_name)
         
         alternatives = []
         
-        for alt_template in self.available_templates:
+        scores = self._score_templates(requirements.get("dimensions", [4000, 3000]),
+                                       12000000,  # Default area
+                                       requirements.get("style", "modern"),
+                                       frozenset(requirements.get("appliances", [])),
+                                       requirements.get("layout_preference", ""),
+                                       requirements.get("budget", "mid_range"))
+        
+        for alt_template, score in zip(self.available_templates, scores):
             if alt_template == template_name:
                 continue
             
@@ -230,21 +298,12 @@ class AgentZeroHelpers:
             if not template_info:
                 continue
             
-            # Calculate match score
-            score = self._score_template_match(alt_template, 
-                                             requirements.get("dimensions", [4000, 3000]),
-                                             12000000,  # Default area
-                                             requirements.get("style", "modern"),
-                                             requirements.get("appliances", []),
-                                             requirements.get("layout_preference", ""),
-                                             requirements.get("budget", "mid_range"))
-            
             # Generate recommendation reason
             reason = self._generate_alternative_reason(template_info, requirements)
             
             alternatives.append({
                 "template_name": alt_template,
-                "match_score": score,
+                "match_score": float(score),
                 "reason": reason,
                 "description": template_info.get("description", ""),
                 "dimensions": template_info.get("parameters", {}).get("recommended_dimensions", [])
@@ -255,13 +314,28 @@ class AgentZeroHelpers:
         
         return alternatives[:3]  # Return top 3 alternatives
     
+    def _extract_requirements(self, text: str) -> Dict[str, Any]:
+        """Run translation and all extractors on text."""
+        # Translate German terms first
+        translated_text = self.translate_german_terms(text)
+        text_lower = translated_text.lower()
+        keyword_hits = self._match_vocabulary_keywords(text_lower)
+        
+        return {
+            "dimensions": self._extract_dimensions(translated_text),
+            "style": self._extract_style(keyword_hits),
+            "appliances": self._extract_appliances(keyword_hits),
+            "layout_preference": self._extract_layout(keyword_hits),
+            "budget": self._extract_budget(keyword_hits),
+            "special_requirements": self._extract_special_requirements(text_lower)
+        }
+    
     def _load_vocabulary(self) -> Dict[str, Any]:
         """Load kitchen vocabulary from JSON file."""
         try:
             vocab_file = Path(self.vocabulary_path)
             if vocab_file.exists():
-                with open(vocab_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return _json_loads(vocab_file.read_bytes())
             else:
                 logger.warning(f"Vocabulary file not found: {vocab_file}")
                 return self._get_default_vocabulary()
@@ -269,152 +343,280 @@ class AgentZeroHelpers:
             logger.error(f"Error loading vocabulary: {e}")
             return self._get_default_vocabulary()
     
+    @staticmethod
+    def _lowercase_keywords(vocabulary: Dict[str, Any]) -> Dict[str, Any]:
+        """Store keyword lists of the matched vocabulary sections as lowercased tuples."""
+        for kind in _KEYWORD_KINDS:
+            categories = vocabulary.get(kind)
+            if isinstance(categories, dict):
+                vocabulary[kind] = {
+                    category: tuple(keyword.lower() for keyword in keywords)
+                    for category, keywords in categories.items()
+                }
+        return vocabulary
+    
+    def _compile_translations(self) -> Tuple[Dict[str, str], "re.Pattern[str]"]:
+        """
+        Build the combined German phrase/term mapping and its union pattern.
+        
+        Keys are lowercased and transliterated, and the pattern accepts each
+        term with either umlauts or their transliteration. Phrases may contain
+        spaces and punctuation, so they are matched without word boundaries
+        and tried first; single terms keep their word boundaries to avoid
+        partial matches.
+        
+        Phrases used to be replaced one after another in _GERMAN_PHRASES order,
+        so an earlier phrase won where two overlap ("moderne küche mit insel"
+        became "moderne kitchen with island"). Each phrase therefore refuses to
+        match when an earlier phrase starts inside its tail.
+        """
+        german_mapping = {
+            german.lower().translate(_GERMAN_NORMALIZE_TABLE): english
+            for german, english in self.vocabulary.get("german_to_english", {}).items()
+        }
+        phrase_mapping = {
+            german.translate(_GERMAN_NORMALIZE_TABLE): english
+            for german, english in _GERMAN_PHRASES
+        }
+        
+        phrases = list(phrase_mapping)
+        branches = []
+        for i, phrase in sorted(enumerate(phrases), key=lambda item: len(item[1]), reverse=True):
+            branch = self._german_alternation([phrase])
+            # Remainders of earlier phrases that would start inside this one
+            tails = {
+                earlier[k:]
+                for earlier in phrases[:i]
+                for k in range(1, min(len(phrase), len(earlier)))
+                if phrase.endswith(earlier[:k])
+            }
+            if tails:
+                branch += '(?!' + self._german_alternation(tails) + ')'
+            branches.append(branch)
+        
+        pattern = '|'.join(branches)
+        if german_mapping:
+            pattern += r'|\b(?:' + self._german_alternation(german_mapping) + r')\b'
+        
+        return {**german_mapping, **phrase_mapping}, re.compile(pattern)
+    
+    @staticmethod
+    def _union_alternation(terms: Iterable[str]) -> str:
+        """Join escaped terms longest first so longer terms win over their prefixes."""
+        return '|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+    
+    @classmethod
+    def _german_alternation(cls, terms: Iterable[str]) -> str:
+        """Like _union_alternation, but each transliterated term also matches its umlaut spelling."""
+        return _GERMAN_SPELLING_RE.sub(
+            lambda m: _GERMAN_SPELLINGS[m.group(0)], cls._union_alternation(terms))
+    
+    def _compile_keyword_matcher(self) -> Tuple[Dict[str, FrozenSet[Tuple[str, str]]], Optional["re.Pattern[str]"]]:
+        """
+        Compile all vocabulary keywords into a single overlapping-match pattern.
+        
+        Each keyword maps to the (kind, category) pairs it implies,
+        including those of every keyword contained in it. The pattern finds the
+        longest keyword starting at each position, so together they report every
+        keyword occurring anywhere in the text in one scan.
+        """
+        payloads: Dict[str, Set[Tuple[str, str]]] = {}
+        for kind in _KEYWORD_KINDS:
+            for category, keywords in self.vocabulary.get(kind, {}).items():
+                for keyword in keywords:
+                    payloads.setdefault(keyword, set()).add((kind, category))
+        
+        if not payloads:
+            return {}, None
+        
+        keyword_hits = {
+            keyword: frozenset().union(*(payloads[other] for other in payloads if other in keyword))
+            for keyword in payloads
+        }
+        return keyword_hits, re.compile(r'(?=(' + self._union_alternation(payloads) + r'))')
+    
+    def _match_vocabulary_keywords(self, text_lower: str) -> Set[Tuple[str, str]]:
+        """Return the (kind, category) pairs of all vocabulary keywords found in lowercased text."""
+        hits: Set[Tuple[str, str]] = set()
+        if self._keyword_re is not None:
+            for match in self._keyword_re.finditer(text_lower):
+                hits |= self._keyword_hits[match.group(1)]
+        return hits
+    
     def _load_available_templates(self) -> List[str]:
         """Load list of available template names."""
-        templates = []
-        if self.templates_dir.exists():
-            for json_file in self.templates_dir.glob("*.json"):
-                templates.append(json_file.stem)
+        templates = self._list_template_names()
         
         if not templates:
             logger.warning("No templates found, using defaults")
             templates = ["modern_l_shaped", "compact_galley", "u_shaped_luxury", 
                         "open_plan_modern", "traditional_country"]
         
-        logger.info(f"Available templates: {templates}")
+        logger.info("Available templates: %s", templates)
         return templates
     
-    def _score_template_match(self, template_name: str, dimensions: List[int], 
-                            room_area: int, style: str, appliances: List[str],
-                            layout_pref: str, budget: str) -> float:
-        """Calculate match score for a template."""
-        score = 0.0
+    def _list_template_names(self) -> List[str]:
+        """List template file stems, globbing again only when the directory changes."""
+        try:
+            mtime = self.templates_dir.stat().st_mtime_ns
+        except OSError:
+            return []
+        
+        cache_key = str(self.templates_dir.absolute())
+        cached = _TEMPLATE_NAMES_CACHE.get(cache_key)
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
         
-        # Load template for scoring
-        template_info = self._get_template_info(template_name)
-        if not template_info:
-            return 0.0
+        templates = [json_file.stem for json_file in self.templates_dir.glob("*.json")]
+        _TEMPLATE_NAMES_CACHE[cache_key] = (mtime, tuple(templates))
+        return templates
+    
+    def _load_template_features(self) -> Dict[str, TemplateFeatures]:
+        """Precompute scoring features for every available template."""
+        features = {}
+        for template_name in self.available_templates:
+            template_info = self._get_template_info(template_name)
+            if not template_info:
+                continue
+            
+            parameters = template_info.get("parameters", {})
+            template_dims = parameters.get("recommended_dimensions", [4000, 3000])
+            features[template_name] = TemplateFeatures(
+                width=template_dims[0] if template_dims else None,
+                height=template_dims[1] if template_dims else None,
+                layout=parameters.get("layout_type", ""),
+                style=parameters.get("style", "modern").lower(),
+                appliances=frozenset(template_info.get("appliances_included", []))
+            )
+        return features
+    
+    def _build_dimension_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Lay out recommended template dimensions as arrays aligned with available_templates."""
+        widths, heights, has_dims = [], [], []
+        for template_name in self.available_templates:
+            features = self._features.get(template_name)
+            if features is not None and features.width is not None:
+                widths.append(features.width)
+                heights.append(features.height)
+                has_dims.append(True)
+            else:
+                # Placeholder keeps the ratio math finite; masked out by has_dims
+                widths.append(1.0)
+                heights.append(1.0)
+                has_dims.append(False)
+        return (np.array(widths, dtype=float), np.array(heights, dtype=float),
+                np.array(has_dims, dtype=bool))
+    
+    def _score_templates(self, dimensions: List[int], room_area: int, style: str,
+                         required_appliances: FrozenSet[str], layout_pref: str, budget: str) -> np.ndarray:
+        """Calculate match scores for all available templates, in available_templates order."""
+        scores = np.zeros(len(self.available_templates))
         
         # Dimension scoring (40% weight)
         if dimensions and len(dimensions) >= 2:
-            template_dims = template_info.get("parameters", {}).get("recommended_dimensions", [4000, 3000])
-            if template_dims:
-                # Calculate how well dimensions match
-                width_ratio = min(dimensions[0], template_dims[0]) / max(dimensions[0], template_dims[0])
-                height_ratio = min(dimensions[1], template_dims[1]) / max(dimensions[1], template_dims[1])
-                dimension_score = (width_ratio + height_ratio) / 2
-                score += dimension_score * 0.4
-        
-        # Layout preference scoring (25% weight)
-        template_layout = template_info.get("parameters", {}).get("layout_type", "")
-        if layout_pref and template_layout:
-            if layout_pref in template_layout or template_layout in layout_pref:
-                score += 0.25
-        
-        # Style preference scoring (20% weight) 
-        template_style = template_info.get("parameters", {}).get("style", "modern")
-        if style and template_style:
-            if style.lower() == template_style.lower():
-                score += 0.2
-            elif any(s in template_style.lower() for s in [style.lower()]):
-                score += 0.1
-        
-        # Appliance requirements scoring (15% weight)
-        template_appliances = set(template_info.get("appliances_included", []))
-        required_appliances = set(appliances)
-        if required_appliances:
-            appliance_match = len(required_appliances.intersection(template_appliances)) / len(required_appliances)
-            score += appliance_match * 0.15
-        
-        return score
+            # Calculate how well dimensions match
+            width_ratio = np.minimum(dimensions[0], self._tpl_w) / np.maximum(dimensions[0], self._tpl_w)
+            height_ratio = np.minimum(dimensions[1], self._tpl_h) / np.maximum(dimensions[1], self._tpl_h)
+            dimension_score = (width_ratio + height_ratio) / 2
+            scores += np.where(self._tpl_has_dims, dimension_score * 0.4, 0.0)
+        
+        style = style.lower() if style else style
+        
+        for i, template_name in enumerate(self.available_templates):
+            features = self._features.get(template_name)
+            if features is None:
+                continue
+            
+            # Layout preference scoring (25% weight)
+            template_layout = features.layout
+            if layout_pref and template_layout:
+                if layout_pref in template_layout or template_layout in layout_pref:
+                    scores[i] += 0.25
+            
+            # Style preference scoring (20% weight) 
+            template_style = features.style
+            if style and template_style:
+                if style == template_style:
+                    scores[i] += 0.2
+                elif style in template_style:
+                    scores[i] += 0.1
+            
+            # Appliance requirements scoring (15% weight)
+            if required_appliances:
+                appliance_match = len(required_appliances & features.appliances) / len(required_appliances)
+                scores[i] += appliance_match * 0.15
+        
+        return scores
     
     def _get_template_info(self, template_name: str) -> Optional[Dict[str, Any]]:
+        """Get template info, reading the JSON file only on first use."""
+        if template_name not in self._template_cache:
+            self._template_cache[template_name] = self._load_template_info(template_name)
+        return self._template_cache[template_name]
+    
+    def _load_template_info(self, template_name: str) -> Optional[Dict[str, Any]]:
         """Load template info from JSON file."""
         try:
             template_file = self.templates_dir / f"{template_name}.json"
             if template_file.exists():
-                with open(template_file, 'r') as f:
-                    return json.load(f)
+                return _json_loads(template_file.read_bytes())
         except Exception as e:
             logger.error(f"Error loading template {template_name}: {e}")
         return None
     
     def _extract_dimensions(self, text: str) -> Optional[List[int]]:
         """Extract dimensions from text."""
-        # Look for patterns like "4x3 meters", "4000x3000", "4 by 3"
-        patterns = [
-            r'(\d+(?:\.\d+)?)\s*x\s*(\d+(?:\.\d+)?)\s*m(?:eters?)?',
-            r'(\d+)\s*by\s*(\d+)\s*m(?:eters?)?',
-            r'(\d{4,})\s*x\s*(\d{4,})'  # For mm values
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                width, height = float(match.group(1)), float(match.group(2))
-                # Convert to mm if needed
-                if width < 100:  # Assume meters
-                    width *= 1000
-                    height *= 1000
-                return [int(width), int(height)]
-        
-        return None
+        match = _DIMS_RE.search(text)
+        if match is None:
+            return None
+        
+        if match.lastgroup != "b":
+            # A lower-priority form matched first; an "AxB m" form later in the
+            # text still wins, so resolve with the patterns in priority order
+            for pattern in _DIM_PATTERNS:
+                match = pattern.search(text)
+                if match:
+                    break
+        
+        width, height = float(match.group(1)), float(match.group(2))
+        # Convert to mm if needed
+        if width < 100:  # Assume meters
+            width *= 1000
+            height *= 1000
+        return [int(width), int(height)]
     
-    def _extract_style(self, text: str) -> str:
-        """Extract style preference from text."""
-        styles = self.vocabulary.get("styles", {})
-        for style_name, keywords in styles.items():
-            for keyword in keywords:
-                if keyword.lower() in text.lower():
-                    return style_name
+    def _extract_style(self, keyword_hits: Set[Tuple[str, str]]) -> str:
+        """Extract style preference from matched vocabulary keywords."""
+        for style_name in self.vocabulary.get("styles", {}):
+            if ("styles", style_name) in keyword_hits:
+                return style_name
         return "modern"  # Default
     
-    def _extract_appliances(self, text: str) -> List[str]:
-        """Extract appliance requirements from text."""
-        found_appliances = []
-        appliances = self.vocabulary.get("appliances", {})
-        
-        for appliance_name, keywords in appliances.items():
-            for keyword in keywords:
-                if keyword.lower() in text.lower():
-                    if appliance_name not in found_appliances:
-                        found_appliances.append(appliance_name)
-        
-        return found_appliances
-    
-    def _extract_layout(self, text: str) -> str:
-        """Extract layout preference from text."""
-        layouts = self.vocabulary.get("layouts", {})
-        for layout_name, keywords in layouts.items():
-            for keyword in keywords:
-                if keyword.lower() in text.lower():
-                    return layout_name
+    def _extract_appliances(self, keyword_hits: Set[Tuple[str, str]]) -> List[str]:
+        """Extract appliance requirements from matched vocabulary keywords."""
+        return [
+            appliance_name for appliance_name in self.vocabulary.get("appliances", {})
+            if ("appliances", appliance_name) in keyword_hits
+        ]
+    
+    def _extract_layout(self, keyword_hits: Set[Tuple[str, str]]) -> str:
+        """Extract layout preference from matched vocabulary keywords."""
+        for layout_name in self.vocabulary.get("layouts", {}):
+            if ("layouts", layout_name) in keyword_hits:
+                return layout_name
         return ""
     
-    def _extract_budget(self, text: str) -> str:
-        """Extract budget category from text."""
-        budget_indicators = self.vocabulary.get("budget_indicators", {})
-        for budget_category, keywords in budget_indicators.items():
-            for keyword in keywords:
-                if keyword.lower() in text.lower():
-                    return budget_category
+    def _extract_budget(self, keyword_hits: Set[Tuple[str, str]]) -> str:
+        """Extract budget category from matched vocabulary keywords."""
+        for budget_category in self.vocabulary.get("budget_indicators", {}):
+            if ("budget_indicators", budget_category) in keyword_hits:
+                return budget_category
         return "mid_range"  # Default
     
-    def _extract_special_requirements(self, text: str) -> List[str]:
-        """Extract special requirements from text."""
-        special_reqs = []
-        
-        # Common special requirements
-        if any(word in text.lower() for word in ["accessible", "wheelchair", "disability"]):
-            special_reqs.append("accessibility_compliant")
-        
-        if any(word in text.lower() for word in ["professional", "chef", "commercial"]):
-            special_reqs.append("professional_grade")
-        
-        if any(word in text.lower() for word in ["entertaining", "party", "guests"]):
-            special_reqs.append("entertainment_focused")
-        
-        return special_reqs
+    def _extract_special_requirements(self, text_lower: str) -> List[str]:
+        """Extract special requirements from lowercased text."""
+        found = {match.lastgroup for match in _SPECIAL_RE.finditer(text_lower)}
+        return [requirement for requirement in _SPECIAL_REQUIREMENTS if requirement in found]
     
     def _validate_customization(self, customization: Dict[str, Any]) -> List[str]:
         """Validate customization parameters."""
@@ -425,7 +627,7 @@ class AgentZeroHelpers:
             dims = customization["dimensions"]
             if not isinstance(dims, list) or len(dims) != 2:
                 errors.append("Dimensions must be a list of [width, height]")
-            elif not all(isinstance(d, (int, float)) and d > 0 for d in dims):
+            elif not all(isinstance(d, (int, float)) and math.isfinite(d) and d > 0 for d in dims):
                 errors.append("Dimensions must be positive numbers")
         
         # Check appliances format
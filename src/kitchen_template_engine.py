@@ -8,11 +8,85 @@ client specifications and uses these templates to create structured JSON request
 
 import json
 import logging
-from typing import Dict, List, Tuple, Optional, Any
+import re
+from itertools import chain
+from typing import Dict, List, Tuple, Optional, Any, Callable
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Template fields needed for listing and scoring; DXF geometry is built on first use
+TEMPLATE_METADATA = {
+    "modern_l_shaped": {
+        "description": "Modern L-shaped kitchen with optional island",
+        "style": "modern",
+        "parameters": {
+            "min_dimensions": [3000, 2500],
+            "recommended_dimensions": [4000, 3000]
+        },
+        "appliances_included": ["refrigerator", "stove", "sink", "dishwasher"]
+    },
+    "compact_galley": {
+        "description": "Compact galley kitchen for small spaces",
+        "style": "modern",
+        "parameters": {
+            "min_dimensions": [1800, 2400],
+            "recommended_dimensions": [2400, 3600]
+        },
+        "appliances_included": ["refrigerator", "stove", "sink"]
+    },
+    "u_shaped_luxury": {
+        "description": "Luxury U-shaped kitchen with premium appliances",
+        "style": "modern",
+        "parameters": {
+            "min_dimensions": [4000, 3500],
+            "recommended_dimensions": [5000, 4000]
+        },
+        "appliances_included": ["refrigerator", "stove", "sink", "dishwasher", "oven", "microwave"]
+    },
+    "open_plan_modern": {
+        "description": "Open plan modern kitchen with dining integration",
+        "style": "modern",
+        "parameters": {
+            "min_dimensions": [5000, 4000],
+            "recommended_dimensions": [6000, 4500]
+        },
+        "appliances_included": ["island", "refrigerator", "stove", "sink", "dishwasher"]
+    },
+    "traditional_country": {
+        "description": "Traditional country-style kitchen with farmhouse elements",
+        "style": "traditional",
+        "parameters": {
+            "min_dimensions": [3500, 3000],
+            "recommended_dimensions": [4500, 3500]
+        },
+        "appliances_included": ["refrigerator", "stove", "sink", "pantry"]
+    }
+}
+
+# Layer color scheme per style, applied by _apply_style
+_STYLE_COLORS = {
+    "modern": {"cabinets": 3, "appliances": 5, "accent": 1},
+    "traditional": {"cabinets": 6, "appliances": 4, "accent": 2},
+    "industrial": {"cabinets": 8, "appliances": 9, "accent": 7}
+}
+
+# Style colors keyed by the layer name they recolor
+_STYLE_LAYER_COLORS = {
+    style: {"Cabinets": colors["cabinets"], "Appliances": colors["appliances"]}
+    for style, colors in _STYLE_COLORS.items()
+}
+
 class KitchenTemplateEngine:
     """
     Template-based kitchen DXF generation engine for Agent Zero.
@@ -27,11 +101,24 @@ class KitchenTemplateEngine:
         valid_json = engine.validate_kitchen_json(customized)
     """
     
+    __slots__ = (
+        "vocabulary_path", "vocabulary", "_german_map", "_german_re",
+        "_template_meta", "_template_factories", "_template_names", "_template_blobs",
+        "_rec_dims", "_has_rec_dims", "_template_styles", "_appliance_index", "_appliance_matrix"
+    )
+    
     def __init__(self, vocabulary_path: str = "kitchen_vocabulary.json"):
         """Initialize with kitchen vocabulary for term translation."""
         self.vocabulary_path = vocabulary_path
         self.vocabulary = self._load_vocabulary()
-        self.templates = self._load_templates()
+        self._german_map, self._german_re = self._compile_german_terms()
+        self._template_meta = TEMPLATE_METADATA
+        self._template_factories = self._load_templates()
+        self._template_names = list(self._template_meta.keys())
+        (self._rec_dims, self._has_rec_dims, self._template_styles,
+         self._appliance_index, self._appliance_matrix) = self._build_score_arrays()
+        # Serialized on first request so get_template can hand out fresh copies cheaply
+        self._template_blobs: Dict[str, Any] = {}
         logger.info("Kitchen template engine initialized")
     
     def _load_vocabulary(self) -> Dict[str, Any]:
@@ -39,8 +126,7 @@ class KitchenTemplateEngine:
         try:
             vocab_file = Path(__file__).parent.parent / self.vocabulary_path
             if vocab_file.exists():
-                with open(vocab_file, 'r') as f:
-                    return json.load(f)
+                return json.loads(vocab_file.read_bytes())
             else:
                 logger.warning(f"Vocabulary file not found: {vocab_file}")
                 return self._get_default_vocabulary()
@@ -69,14 +155,14 @@ class KitchenTemplateEngine:
             "appliances": ["island", "sink", "stove", "refrigerator", "dishwasher", "oven", "microwave"]
         }
     
-    def _load_templates(self) -> Dict[str, Dict[str, Any]]:
-        """Load predefined kitchen templates."""
+    def _load_templates(self) -> Dict[str, Callable[[], Dict[str, Any]]]:
+        """Map predefined kitchen template names to the methods that build them."""
         return {
-            "modern_l_shaped": self._get_modern_l_shaped_template(),
-            "compact_galley": self._get_compact_galley_template(),
-            "u_shaped_luxury": self._get_u_shaped_luxury_template(),
-            "open_plan_modern": self._get_open_plan_template(),
-            "traditional_country": self._get_traditional_template()
+            "modern_l_shaped": self._get_modern_l_shaped_template,
+            "compact_galley": self._get_compact_galley_template,
+            "u_shaped_luxury": self._get_u_shaped_luxury_template,
+            "open_plan_modern": self._get_open_plan_template,
+            "traditional_country": self._get_traditional_template
         }
     
     def get_template(self, template_name: str) -> Dict[str, Any]:
@@ -92,27 +178,42 @@ class KitchenTemplateEngine:
         Raises:
             ValueError: If template name is not found
         """
-        if template_name not in self.templates:
-            available = list(self.templates.keys())
-            raise ValueError(f"Template '{template_name}' not found. Available: {available}")
+        self._check_template_name(template_name)
+        
+        blob = self._template_blobs.get(template_name)
+        if blob is None:
+            blob = self._template_blobs[template_name] = _json_dumps(self._template_factories[template_name]())
         
-        # Return a deep copy to prevent modification of original template
-        import copy
-        return copy.deepcopy(self.templates[template_name])
+        # Decode a fresh copy to prevent modification of original template
+        return _json_loads(blob)
+    
+    def _check_template_name(self, template_name: str) -> None:
+        """Raise ValueError if template name is not found."""
+        if template_name not in self._template_meta:
+            available = list(self._template_meta.keys())
+            raise ValueError(f"Template '{template_name}' not found. Available: {available}")
     
     def list_templates(self) -> List[str]:
         """Get list of available template names."""
-        return list(self.templates.keys())
+        return list(self._template_meta.keys())
+    
+    @property
+    def templates(self) -> Dict[str, Dict[str, Any]]:
+        """All templates by name, as fresh copies; builds every payload on access."""
+        return {name: self.get_template(name) for name in self._template_meta}
     
     def get_template_info(self, template_name: str) -> Dict[str, Any]:
         """Get information about a specific template."""
-        template = self.get_template(template_name)
+        self._check_template_name(template_name)
+        
+        # Read-only access; only the returned lists need copying
+        template = self._template_meta[template_name]
         return {
             "name": template_name,
             "description": template.get("description", ""),
-            "recommended_dimensions": template.get("parameters", {}).get("recommended_dimensions", []),
-            "min_dimensions": template.get("parameters", {}).get("min_dimensions", []),
-            "appliances_included": template.get("appliances_included", []),
+            "recommended_dimensions": list(template.get("parameters", {}).get("recommended_dimensions", [])),
+            "min_dimensions": list(template.get("parameters", {}).get("min_dimensions", [])),
+            "appliances_included": list(template.get("appliances_included", [])),
             "style": template.get("style", "modern")
         }
     
@@ -125,11 +226,12 @@ class KitchenTemplateEngine:
             params: Customization parameters
             
         Returns:
-            Customized template dictionary
+            Customized template dictionary. The input template is not modified;
+            sub-trees that no customization touches are shared with it.
         """
-        logger.info(f"Customizing template with params: {params}")
+        logger.info("Customizing template with params: %s", params)
         
-        customized = template.copy()
+        customized = template
         
         # Apply dimensions if provided
         if "dimensions" in params:
@@ -147,7 +249,8 @@ class KitchenTemplateEngine:
         if "custom_properties" in params:
             customized = self._apply_custom_properties(customized, params["custom_properties"])
         
-        return customized
+        # Always hand back a new top-level dict, even when nothing applied
+        return customized if customized is not template else {**template}
     
     def validate_kitchen_json(self, kitchen_json: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -209,19 +312,18 @@ class KitchenTemplateEngine:
         appliances = requirements.get("appliances", [])
         budget = requirements.get("budget", "medium").lower()
         
-        # Score each template
-        for template_name, template in self.templates.items():
-            score = self._score_template(template, dimensions, style, appliances, budget)
+        # Score all templates at once, then rank by score (highest first)
+        scores = self._score_templates(dimensions, style, appliances)
+        for i in np.argsort(-scores, kind="stable"):
+            template_name = self._template_names[i]
+            template = self._template_meta[template_name]
             suggestions.append({
                 "template_name": template_name,
-                "score": score,
+                "score": float(scores[i]),
                 "description": template.get("description", ""),
                 "reasons": self._get_suggestion_reasons(template, requirements)
             })
         
-        # Sort by score (highest first)
-        suggestions.sort(key=lambda x: x["score"], reverse=True)
-        
         return suggestions
     
     def translate_german_terms(self, text: str) -> str:
@@ -234,16 +336,30 @@ class KitchenTemplateEngine:
         Returns:
             Text with German terms translated to English
         """
-        german_to_english = self.vocabulary.get("german_to_english", {})
-        
         translated = text.lower()
-        for german, english in german_to_english.items():
-            translated = translated.replace(german, english)
+        if self._german_re is None:
+            return translated
+        
+        german_map = self._german_map
+        return self._german_re.sub(lambda match: german_map[match.group(0)], translated)
+    
+    def _compile_german_terms(self) -> Tuple[Dict[str, str], Optional["re.Pattern[str]"]]:
+        """
+        Build the German term mapping and a single alternation matching all terms.
+        
+        Terms are tried longest first so a compound such as "geschirrspüler" is
+        not shadowed by a shorter term it contains. The pattern is None when
+        the vocabulary has no German terms.
+        """
+        german_map = dict(self.vocabulary.get("german_to_english", {}))
+        if not german_map:
+            return german_map, None
         
-        return translated
+        terms = sorted(german_map, key=len, reverse=True)
+        return german_map, re.compile("|".join(re.escape(term) for term in terms))
     
     def _apply_dimensions(self, template: Dict[str, Any], dimensions: List[int]) -> Dict[str, Any]:
-        """Apply dimensional scaling to template."""
+        """Return template with dimensional scaling applied."""
         if len(dimensions) < 2:
             logger.warning("Dimensions must have at least width and height")
             return template
@@ -252,56 +368,52 @@ class KitchenTemplateEngine:
         
         # Scale all figures to new dimensions
         if "dxf_template" in template and "figures" in template["dxf_template"]:
+            figures = []
             for figure in template["dxf_template"]["figures"]:
                 if figure.get("type") == "rectangle" and "points" in figure:
                     # Scale room perimeter
                     if len(figure["points"]) == 4:
-                        figure["points"] = [
+                        figure = {**figure, "points": [
                             [0, 0], [width, 0], [width, height], [0, height]
-                        ]
+                        ]}
                 
                 # Scale other elements proportionally (simplified)
                 # In a full implementation, this would be more sophisticated
+                figures.append(figure)
+            
+            return {**template, "dxf_template": {**template["dxf_template"], "figures": figures}}
         
         return template
     
     def _apply_style(self, template: Dict[str, Any], style: str) -> Dict[str, Any]:
-        """Apply style modifications to template."""
-        style_colors = {
-            "modern": {"cabinets": 3, "appliances": 5, "accent": 1},
-            "traditional": {"cabinets": 6, "appliances": 4, "accent": 2},
-            "industrial": {"cabinets": 8, "appliances": 9, "accent": 7}
-        }
-        
-        if style in style_colors and "dxf_template" in template:
-            colors = style_colors[style]
-            
+        """Return template with style modifications applied."""
+        layer_colors = _STYLE_LAYER_COLORS.get(style)
+        if layer_colors is not None and "dxf_template" in template:
             # Apply color scheme to layers
             if "layers" in template["dxf_template"]:
+                layers = []
                 for layer in template["dxf_template"]["layers"]:
-                    if layer["name"] == "Cabinets":
-                        layer["color"] = colors["cabinets"]
-                    elif layer["name"] == "Appliances":
-                        layer["color"] = colors["appliances"]
+                    color = layer_colors.get(layer["name"])
+                    if color is not None:
+                        layer = {**layer, "color": color}
+                    layers.append(layer)
+                
+                return {**template, "dxf_template": {**template["dxf_template"], "layers": layers}}
         
         return template
     
     def _apply_appliances(self, template: Dict[str, Any], appliances: List[str]) -> Dict[str, Any]:
-        """Add or modify appliances in template."""
+        """Return template with appliances added."""
         # This would add appliance entities to the figures list
         # Simplified implementation for now
-        if "appliances_included" not in template:
-            template["appliances_included"] = []
+        appliances_included = chain(template.get("appliances_included", ()), appliances)
         
-        template["appliances_included"].extend(appliances)
-        template["appliances_included"] = list(set(template["appliances_included"]))  # Remove duplicates
-        
-        return template
+        # Remove duplicates, keeping first-seen order
+        return {**template, "appliances_included": list(dict.fromkeys(appliances_included))}
     
     def _apply_custom_properties(self, template: Dict[str, Any], properties: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply custom properties to template."""
-        template.update(properties)
-        return template
+        """Return template with custom properties applied."""
+        return {**template, **properties}
     
     def _validate_layers(self, layers: List[Dict[str, Any]]) -> Dict[str, List[str]]:
         """Validate layer definitions."""
@@ -362,37 +474,68 @@ class KitchenTemplateEngine:
         
         return result
     
-    def _score_template(self, template: Dict[str, Any], dimensions: List[int], 
-                       style: str, appliances: List[str], budget: str) -> float:
-        """Score template based on requirements."""
-        score = 0.0
+    def _build_score_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, int], np.ndarray]:
+        """
+        Lay out template scoring features as arrays aligned with _template_names.
+        
+        Returns recommended dimensions (N, 2) with a mask of templates that have
+        them, lowercased styles, and a template-by-appliance membership matrix
+        with the column index of each appliance name.
+        """
+        rec_dims, has_rec_dims, styles = [], [], []
+        appliance_index: Dict[str, int] = {}
+        for template in self._template_meta.values():
+            dims = template.get("parameters", {}).get("recommended_dimensions", [])
+            if dims and len(dims) >= 2:
+                rec_dims.append(dims[:2])
+                has_rec_dims.append(True)
+            else:
+                # Placeholder keeps the ratio math finite; masked out by has_rec_dims
+                rec_dims.append([1, 1])
+                has_rec_dims.append(False)
+            styles.append(template.get("style", "").lower())
+            for appliance in template.get("appliances_included", []):
+                appliance_index.setdefault(appliance, len(appliance_index))
+        
+        appliance_matrix = np.zeros((len(self._template_meta), len(appliance_index)), dtype=bool)
+        for row, template in enumerate(self._template_meta.values()):
+            for appliance in template.get("appliances_included", []):
+                appliance_matrix[row, appliance_index[appliance]] = True
+        
+        return (np.array(rec_dims, dtype=float).reshape(-1, 2), np.array(has_rec_dims, dtype=bool),
+                np.array(styles, dtype=str), appliance_index, appliance_matrix)
+    
+    def _score_templates(self, dimensions: List[int], style: str, appliances: List[str]) -> np.ndarray:
+        """
+        Score all templates against requirements, in _template_names order.
+        
+        Dimension closeness is worth up to 0.4, an exact (0.3) or partial (0.15)
+        style match, and the share of requested appliances included up to 0.3;
+        each score is capped at 1.0.
+        """
+        scores = np.zeros(len(self._template_names))
         
         # Dimension scoring
-        if dimensions:
-            rec_dims = template.get("parameters", {}).get("recommended_dimensions", [])
-            if rec_dims and len(dimensions) >= 2 and len(rec_dims) >= 2:
-                width_diff = abs(dimensions[0] - rec_dims[0]) / rec_dims[0]
-                height_diff = abs(dimensions[1] - rec_dims[1]) / rec_dims[1]
-                dimension_score = max(0, 1 - (width_diff + height_diff) / 2)
-                score += dimension_score * 0.4
+        if dimensions and len(dimensions) >= 2:
+            width_diff = np.abs(dimensions[0] - self._rec_dims[:, 0]) / self._rec_dims[:, 0]
+            height_diff = np.abs(dimensions[1] - self._rec_dims[:, 1]) / self._rec_dims[:, 1]
+            dimension_score = np.maximum(0, 1 - (width_diff + height_diff) / 2)
+            scores += np.where(self._has_rec_dims, dimension_score * 0.4, 0.0)
         
         # Style scoring
-        template_style = template.get("style", "").lower()
-        if style and template_style == style:
-            score += 0.3
-        elif style and style in template_style:
-            score += 0.15
+        if style:
+            exact = self._template_styles == style
+            partial = np.char.find(self._template_styles, style) >= 0
+            scores += np.where(exact, 0.3, np.where(partial, 0.15, 0.0))
         
         # Appliance scoring
-        template_appliances = set(template.get("appliances_included", []))
         requested_appliances = set(appliances)
         if requested_appliances:
-            overlap = len(template_appliances & requested_appliances)
-            total_requested = len(requested_appliances)
-            appliance_score = overlap / total_requested if total_requested > 0 else 0
-            score += appliance_score * 0.3
+            columns = [self._appliance_index[a] for a in requested_appliances if a in self._appliance_index]
+            overlap = self._appliance_matrix[:, columns].sum(axis=1)
+            scores += overlap / len(requested_appliances) * 0.3
         
-        return min(score, 1.0)  # Cap at 1.0
+        return np.minimum(scores, 1.0)  # Cap at 1.0
     
     def _get_suggestion_reasons(self, template: Dict[str, Any], requirements: Dict[str, Any]) -> List[str]:
         """Get reasons why a template was suggested."""
@@ -417,13 +560,7 @@ class KitchenTemplateEngine:
     def _get_modern_l_shaped_template(self) -> Dict[str, Any]:
         """Get modern L-shaped kitchen template."""
         return {
-            "description": "Modern L-shaped kitchen with optional island",
-            "style": "modern",
-            "parameters": {
-                "min_dimensions": [3000, 2500],
-                "recommended_dimensions": [4000, 3000]
-            },
-            "appliances_included": ["refrigerator", "stove", "sink", "dishwasher"],
+            **TEMPLATE_METADATA["modern_l_shaped"],
             "dxf_template": {
                 "layers": [
                     {"name": "Walls", "color": 7},
@@ -455,13 +592,7 @@ class KitchenTemplateEngine:
     def _get_compact_galley_template(self) -> Dict[str, Any]:
         """Get compact galley kitchen template."""
         return {
-            "description": "Compact galley kitchen for small spaces",
-            "style": "modern",
-            "parameters": {
-                "min_dimensions": [1800, 2400],
-                "recommended_dimensions": [2400, 3600]
-            },
-            "appliances_included": ["refrigerator", "stove", "sink"],
+            **TEMPLATE_METADATA["compact_galley"],
             "dxf_template": {
                 "layers": [
                     {"name": "Walls", "color": 7},
@@ -491,13 +622,7 @@ class KitchenTemplateEngine:
     def _get_u_shaped_luxury_template(self) -> Dict[str, Any]:
         """Get U-shaped luxury kitchen template."""
         return {
-            "description": "Luxury U-shaped kitchen with premium appliances",
-            "style": "modern",
-            "parameters": {
-                "min_dimensions": [4000, 3500],
-                "recommended_dimensions": [5000, 4000]
-            },
-            "appliances_included": ["refrigerator", "stove", "sink", "dishwasher", "oven", "microwave"],
+            **TEMPLATE_METADATA["u_shaped_luxury"],
             "dxf_template": {
                 "layers": [
                     {"name": "Walls", "color": 7},
@@ -518,13 +643,7 @@ class KitchenTemplateEngine:
     def _get_open_plan_template(self) -> Dict[str, Any]:
         """Get open plan modern kitchen template."""
         return {
-            "description": "Open plan modern kitchen with dining integration",
-            "style": "modern",
-            "parameters": {
-                "min_dimensions": [5000, 4000],
-                "recommended_dimensions": [6000, 4500]
-            },
-            "appliances_included": ["island", "refrigerator", "stove", "sink", "dishwasher"],
+            **TEMPLATE_METADATA["open_plan_modern"],
             "dxf_template": {
                 "layers": [
                     {"name": "Walls", "color": 7},
@@ -545,13 +664,7 @@ class KitchenTemplateEngine:
     def _get_traditional_template(self) -> Dict[str, Any]:
         """Get traditional country kitchen template."""
         return {
-            "description": "Traditional country-style kitchen with farmhouse elements",
-            "style": "traditional",
-            "parameters": {
-                "min_dimensions": [3500, 3000],
-                "recommended_dimensions": [4500, 3500]
-            },
-            "appliances_included": ["refrigerator", "stove", "sink", "pantry"],
+            **TEMPLATE_METADATA["traditional_country"],
             "dxf_template": {
                 "layers": [
                     {"name": "Walls", "color": 7},
@@ -1,8 +1,9 @@
+import functools
+import io
 import os
-import uuid
 import ezdxf
 import json
-import traceback
+import re
 import logging
 from typing import Dict, List, Tuple, Any, Union, Optional
 from pydantic import BaseModel, Field
@@ -13,8 +14,42 @@ from datetime import datetime
 import tempfile
 import atexit
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+def _header_json(value: Any) -> str:
+    """Serialize a value as JSON for an HTTP header, keeping the output ASCII-only."""
+    if orjson is not None:
+        try:
+            text = orjson.dumps(value).decode()
+        except TypeError:
+            text = None
+        # orjson emits raw UTF-8; header values must stay ASCII, so defer to json's escaping
+        if text is not None and text.isascii():
+            return text
+    return json.dumps(value)
+
 TMP_DIR = "/tmp"
 
+# "<width>x<height>" in meters within a legacy semantic description
+LEGACY_DIMENSIONS_RE = re.compile(r'(\d+(?:\.\d+)?)x(\d+(?:\.\d+)?)')
+
+# Characters that are unsafe in download filenames or the Content-Disposition header
+FILENAME_SANITIZE_TABLE = str.maketrans(dict.fromkeys(' /\\\t\n\r"\'<>|?*:;', "_"))
+
+# Error payload for empty bodies (keep-alive probes), answered without parsing
+EMPTY_BODY_RESPONSE = {"error": "Invalid JSON format"}
+
+# Text.set_align() only exists in older ezdxf releases; otherwise set halign/valign
+TEXT_HAS_SET_ALIGN = hasattr(ezdxf.entities.Text, "set_align")
+
+# MTEXT attachment point per alignment (middle row); anything else is middle left
+MTEXT_ATTACHMENT_POINTS = {"CENTER": 5, "RIGHT": 6}
+
 # Configure structured logging FIRST before any imports that might use it
 logging.basicConfig(
     level=logging.INFO,
@@ -31,6 +66,13 @@ except ImportError:
     logger.warning("Template engine not available - Agent Zero features will be disabled")
     KitchenTemplateEngine = None
 
+# Engine construction loads the vocabulary and compiles matchers, so warm
+# invocations share one instance
+@functools.lru_cache(maxsize=1)
+def get_template_engine() -> Any:
+    """Return the shared template engine, created on first use and reused across requests."""
+    return KitchenTemplateEngine()
+
 # Custom Exceptions
 class DXFGenerationError(Exception):
     """Base exception for DXF generation errors."""
@@ -45,7 +87,9 @@ class EntityProcessingError(DXFGenerationError):
     pass
 
 # Processing Summary Data Structures
-@dataclass
+ENTITY_DETAILS_LIMIT = 50  # Per-entity details reported in summaries
+
+@dataclass(slots=True)
 class EntitySummary:
     """Summary of processed entity."""
     type: str
@@ -91,13 +135,15 @@ class ProcessingSummary:
         self.entities_by_type[entity_type] = self.entities_by_type.get(entity_type, 0) + 1
         self.entities_by_layer[layer] = self.entities_by_layer.get(layer, 0) + 1
         
-        # Add detailed entity summary
-        self.entity_details.append(EntitySummary(
-            type=entity_type,
-            layer=layer,
-            success=success,
-            message=message
-        ))
+        # Add detailed entity summary; to_dict only reports details for up to
+        # ENTITY_DETAILS_LIMIT entities, so stop collecting beyond that
+        if self.total_entities <= ENTITY_DETAILS_LIMIT:
+            self.entity_details.append(EntitySummary(
+                type=entity_type,
+                layer=layer,
+                success=success,
+                message=message
+            ))
     
     def add_warning(self, message: str):
         """Add a warning message."""
@@ -127,7 +173,7 @@ class ProcessingSummary:
                     "success": e.success,
                     "message": e.message
                 } for e in self.entity_details
-            ] if len(self.entity_details) <= 50 else f"({len(self.entity_details)} entities - details truncated)"
+            ] if self.total_entities <= ENTITY_DETAILS_LIMIT else f"({self.total_entities} entities - details truncated)"
         }
 
 # File Management System
@@ -143,16 +189,18 @@ class TempFileManager:
         fd, temp_path = tempfile.mkstemp(suffix=suffix, dir=TMP_DIR)
         os.close(fd)  # Close the file descriptor, we just need the path
         self._temp_files.add(temp_path)
-        logger.debug(f"Created temp file: {temp_path}")
+        logger.debug("Created temp file: %s", temp_path)
         return temp_path
     
     def cleanup_file(self, file_path: str):
         """Clean up a specific temporary file."""
         if file_path in self._temp_files:
             try:
-                if os.path.exists(file_path):
+                try:
                     os.remove(file_path)
-                    logger.debug(f"Cleaned up temp file: {file_path}")
+                    logger.debug("Cleaned up temp file: %s", file_path)
+                except FileNotFoundError:
+                    pass
                 self._temp_files.discard(file_path)
             except Exception as e:
                 logger.warning(f"Failed to cleanup temp file {file_path}: {e}")
@@ -161,7 +209,7 @@ class TempFileManager:
         """Clean up all temporary files."""
         for file_path in list(self._temp_files):
             self.cleanup_file(file_path)
-        logger.info(f"Cleaned up {len(self._temp_files)} temporary files")
+        logger.info("Cleaned up %s temporary files", len(self._temp_files))
 
 # Global temp file manager
 temp_file_manager = TempFileManager()
@@ -197,18 +245,19 @@ class RequestValidator:
     def validate_layer_references(body: Dict[str, Any]) -> Optional[str]:
         """Validate that all layer references exist."""
         layer_names = {layer["name"] for layer in body.get("layers", [])}
+        layer_names.add("default")  # Entities may always use the implicit default layer
         
         # Check figures
         for figure in body.get("figures", []):
             layer = figure.get("layer", "default")
-            if layer != "default" and layer not in layer_names:
+            if layer not in layer_names:
                 return f"Figure references undefined layer: '{layer}'"
         
         # Check block entities
         for block in body.get("blocks", []):
             for entity in block.get("entities", []):
                 layer = entity.get("layer", "default")
-                if layer != "default" and layer not in layer_names:
+                if layer not in layer_names:
                     return f"Block entity references undefined layer: '{layer}'"
         
         return None
@@ -227,7 +276,7 @@ class RequestValidator:
         # Add client info logging
         if "client_info" in body:
             client_info = body["client_info"]
-            logger.info(f"Request from client: {client_info}")
+            logger.info("Request from client: %s", client_info)
         
         return body
     
@@ -417,7 +466,8 @@ class GeometryValidator:
             raise ValidationError(f"Point must have at least {min_coords} coordinates, got {len(point)}")
         
         try:
-            [float(coord) for coord in point]
+            for coord in point:
+                float(coord)
             return True
         except (ValueError, TypeError) as e:
             raise ValidationError(f"Invalid coordinate values in point {point}: {e}")
@@ -483,10 +533,46 @@ class CoordinateConverter:
             Tuple of float values, original values if conversion fails
         """
         try:
+            # Unpack the common 2D/3D points directly instead of via map()
+            if type(lst) is list or type(lst) is tuple:
+                n = len(lst)
+                if n == 2:
+                    return (float(lst[0]), float(lst[1]))
+                if n == 3:
+                    return (float(lst[0]), float(lst[1]), float(lst[2]))
             return tuple(map(float, lst))
         except Exception as e:
             logger.warning(f"Error converting coordinates to float: {lst} - {e}")
             return tuple(lst)
+    
+    @staticmethod
+    def validated_points(points: List[List[Union[str, int, float]]], min_coords: int = 2) -> List[Tuple[float, ...]]:
+        """
+        Validate a list of points and convert each to a tuple of floats.
+        
+        Equivalent to GeometryValidator.validate_point followed by
+        safe_tuple_float for every point, but converts each point once.
+        
+        Args:
+            points: List of coordinate lists/tuples
+            min_coords: Minimum number of coordinates required per point
+            
+        Returns:
+            List of float tuples, one per point
+            
+        Raises:
+            ValidationError: For the first invalid point, as validate_point would
+        """
+        if all(isinstance(point, (list, tuple)) and len(point) >= min_coords for point in points):
+            try:
+                return [tuple(map(float, point)) for point in points]
+            except (ValueError, TypeError):
+                pass
+        
+        # Some point is invalid; validate in order to raise the same error as before
+        for point in points:
+            GeometryValidator.validate_point(point, min_coords)
+        return [tuple(map(float, point)) for point in points]
 
 # Entity Processors (Factory Pattern)
 class EntityProcessor(ABC):
@@ -521,13 +607,10 @@ class RectangleProcessor(EntityProcessor):
                 raise EntityProcessingError(f"Rectangle needs at least 3 points, got {len(points_data)}")
             
             # Validate each point
-            validated_points = []
-            for i, point in enumerate(points_data):
-                GeometryValidator.validate_point(point)
-                validated_points.append(CoordinateConverter.safe_tuple_float(point))
+            validated_points = CoordinateConverter.validated_points(points_data)
             
             target.add_lwpolyline(validated_points, close=True, dxfattribs=dxf_attribs)
-            logger.debug(f"Rectangle processed successfully with {len(validated_points)} points")
+            logger.debug("Rectangle processed successfully with %s points", len(validated_points))
             return True
             
         except (ValidationError, EntityProcessingError) as e:
@@ -548,15 +631,18 @@ class CircleProcessor(EntityProcessor):
             if "radius" not in entity_data:
                 raise EntityProcessingError("Circle missing required 'radius' field")
             
+            center_data = entity_data["center"]
+            radius_data = entity_data["radius"]
+            
             # Validate geometry
-            GeometryValidator.validate_point(entity_data["center"])
-            GeometryValidator.validate_radius(entity_data["radius"])
+            GeometryValidator.validate_point(center_data)
+            GeometryValidator.validate_radius(radius_data)
             
-            center = CoordinateConverter.safe_tuple_float(entity_data["center"])
-            radius = float(entity_data["radius"])
+            center = CoordinateConverter.safe_tuple_float(center_data)
+            radius = float(radius_data)
             
             target.add_circle(center=center, radius=radius, dxfattribs=dxf_attribs)
-            logger.debug(f"Circle processed successfully (center: {center}, radius: {radius})")
+            logger.debug("Circle processed successfully (center: %s, radius: %s)", center, radius)
             return True
             
         except (ValidationError, EntityProcessingError) as e:
@@ -574,7 +660,7 @@ class LineProcessor(EntityProcessor):
             start = CoordinateConverter.safe_tuple_float(entity_data["start"])
             end = CoordinateConverter.safe_tuple_float(entity_data["end"])
             target.add_line(start, end, dxfattribs=dxf_attribs)
-            logger.debug(f"Line processed successfully")
+            logger.debug("Line processed successfully")
             return True
         except Exception as e:
             logger.error(f"Error processing line: {e}")
@@ -591,16 +677,11 @@ class TextProcessor(EntityProcessor):
             
             text = target.add_text(text_content, dxfattribs={"height": height, **dxf_attribs})
             text.dxf.insert = position
-            try:
-                try:
-                    text.set_align("LEFT")
-                except AttributeError:
-                    # Fallback for older ezdxf versions
-                    text.dxf.halign = 0  # LEFT align
-            except AttributeError:
-                # Fallback for older ezdxf versions
+            if TEXT_HAS_SET_ALIGN:
+                text.set_align("LEFT")
+            else:
                 text.dxf.halign = 0  # LEFT align
-            logger.debug(f"Text processed successfully")
+            logger.debug("Text processed successfully")
             return True
         except Exception as e:
             logger.error(f"Error processing text: {e}")
@@ -612,21 +693,26 @@ class ArcProcessor(EntityProcessor):
     def process(self, entity_data: Dict[str, Any], target: Any, dxf_attribs: Dict[str, Any]) -> bool:
         try:
             # Validate required fields
-            required_fields = ["center", "radius", "start_angle", "end_angle"]
+            required_fields = ("center", "radius", "start_angle", "end_angle")
             for field in required_fields:
                 if field not in entity_data:
                     raise EntityProcessingError(f"Arc missing required '{field}' field")
             
+            center_data = entity_data["center"]
+            radius_data = entity_data["radius"]
+            start_data = entity_data["start_angle"]
+            end_data = entity_data["end_angle"]
+            
             # Validate geometry
-            GeometryValidator.validate_point(entity_data["center"])
-            GeometryValidator.validate_radius(entity_data["radius"])
-            GeometryValidator.validate_angle(entity_data["start_angle"])
-            GeometryValidator.validate_angle(entity_data["end_angle"])
+            GeometryValidator.validate_point(center_data)
+            GeometryValidator.validate_radius(radius_data)
+            GeometryValidator.validate_angle(start_data)
+            GeometryValidator.validate_angle(end_data)
             
-            center = CoordinateConverter.safe_tuple_float(entity_data["center"])
-            radius = float(entity_data["radius"])
-            start_angle = float(entity_data["start_angle"])
-            end_angle = float(entity_data["end_angle"])
+            center = CoordinateConverter.safe_tuple_float(center_data)
+            radius = float(radius_data)
+            start_angle = float(start_data)
+            end_angle = float(end_data)
             
             target.add_arc(
                 center=center,
@@ -635,7 +721,7 @@ class ArcProcessor(EntityProcessor):
                 end_angle=end_angle,
                 dxfattribs=dxf_attribs
             )
-            logger.debug(f"Arc processed successfully (center: {center}, radius: {radius}, angles: {start_angle}°-{end_angle}°)")
+            logger.debug("Arc processed successfully (center: %s, radius: %s, angles: %s°-%s°)", center, radius, start_angle, end_angle)
             return True
             
         except (ValidationError, EntityProcessingError) as e:
@@ -660,10 +746,7 @@ class SplineProcessor(EntityProcessor):
                 raise EntityProcessingError(f"Spline needs at least 2 control points, got {len(control_points)}")
             
             # Validate control points
-            validated_points = []
-            for i, point in enumerate(control_points):
-                GeometryValidator.validate_point(point)
-                validated_points.append(CoordinateConverter.safe_tuple_float(point))
+            validated_points = CoordinateConverter.validated_points(control_points)
             
             # Create spline with default parameters
             degree = int(entity_data.get("degree", 3))
@@ -674,7 +757,7 @@ class SplineProcessor(EntityProcessor):
             spline.degree = degree
             spline.closed = closed
             
-            logger.debug(f"Spline processed successfully with {len(validated_points)} control points")
+            logger.debug("Spline processed successfully with %s control points", len(validated_points))
             return True
             
         except (ValidationError, EntityProcessingError) as e:
@@ -698,10 +781,7 @@ class PolylineProcessor(EntityProcessor):
                 raise EntityProcessingError(f"Polyline needs at least 2 points, got {len(points_data)}")
             
             # Validate points
-            validated_points = []
-            for i, point in enumerate(points_data):
-                GeometryValidator.validate_point(point)
-                validated_points.append(CoordinateConverter.safe_tuple_float(point))
+            validated_points = CoordinateConverter.validated_points(points_data)
             
             # Determine if 3D based on first point
             is_3d = len(validated_points[0]) > 2
@@ -714,7 +794,7 @@ class PolylineProcessor(EntityProcessor):
             else:
                 polyline = target.add_lwpolyline(validated_points, close=closed, dxfattribs=dxf_attribs)
             
-            logger.debug(f"{'3D ' if is_3d else ''}Polyline processed successfully with {len(validated_points)} points")
+            logger.debug("%sPolyline processed successfully with %s points", '3D ' if is_3d else '', len(validated_points))
             return True
             
         except (ValidationError, EntityProcessingError) as e:
@@ -730,20 +810,24 @@ class EllipseProcessor(EntityProcessor):
     def process(self, entity_data: Dict[str, Any], target: Any, dxf_attribs: Dict[str, Any]) -> bool:
         try:
             # Validate required fields
-            required_fields = ["center", "major_axis"]
+            required_fields = ("center", "major_axis")
             for field in required_fields:
                 if field not in entity_data:
                     raise EntityProcessingError(f"Ellipse missing required '{field}' field")
             
+            center_data = entity_data["center"]
+            major_axis_data = entity_data["major_axis"]
+            
             # Validate geometry
-            GeometryValidator.validate_point(entity_data["center"])
-            GeometryValidator.validate_point(entity_data["major_axis"])
+            GeometryValidator.validate_point(center_data)
+            GeometryValidator.validate_point(major_axis_data)
             
-            center = CoordinateConverter.safe_tuple_float(entity_data["center"])
-            major_axis = CoordinateConverter.safe_tuple_float(entity_data["major_axis"])
-            ratio = float(entity_data.get("ratio", 0.5))
-            start_param = float(entity_data.get("start_param", 0))
-            end_param = float(entity_data.get("end_param", 6.283185))  # 2*pi
+            get = entity_data.get
+            center = CoordinateConverter.safe_tuple_float(center_data)
+            major_axis = CoordinateConverter.safe_tuple_float(major_axis_data)
+            ratio = float(get("ratio", 0.5))
+            start_param = float(get("start_param", 0))
+            end_param = float(get("end_param", 6.283185))  # 2*pi
             
             if not (0 < ratio <= 1):
                 raise EntityProcessingError(f"Ellipse ratio must be between 0 and 1, got {ratio}")
@@ -757,7 +841,7 @@ class EllipseProcessor(EntityProcessor):
                 dxfattribs=dxf_attribs
             )
             
-            logger.debug(f"Ellipse processed successfully (center: {center}, ratio: {ratio})")
+            logger.debug("Ellipse processed successfully (center: %s, ratio: %s)", center, ratio)
             return True
             
         except (ValidationError, EntityProcessingError) as e:
@@ -774,15 +858,11 @@ class SolidProcessor(EntityProcessor):
         try:
             solid_type = entity_data.get("solid_type", "box")
             
-            if solid_type == "box":
-                return self._process_box(entity_data, target, dxf_attribs)
-            elif solid_type == "cylinder":
-                return self._process_cylinder(entity_data, target, dxf_attribs)
-            elif solid_type == "sphere":
-                return self._process_sphere(entity_data, target, dxf_attribs)
-            else:
+            handler = self._handlers.get(solid_type)
+            if handler is None:
                 logger.warning(f"Unsupported solid type: {solid_type}")
                 return False
+            return handler(self, entity_data, target, dxf_attribs)
                 
         except Exception as e:
             logger.error(f"Unexpected error processing solid: {e}")
@@ -790,7 +870,7 @@ class SolidProcessor(EntityProcessor):
     
     def _process_box(self, entity_data: Dict[str, Any], target: Any, dxf_attribs: Dict[str, Any]) -> bool:
         """Process a 3D box solid."""
-        required_fields = ["corner1", "corner2"]
+        required_fields = ("corner1", "corner2")
         for field in required_fields:
             if field not in entity_data:
                 raise EntityProcessingError(f"Box missing required '{field}' field")
@@ -799,25 +879,20 @@ class SolidProcessor(EntityProcessor):
         corner1 = CoordinateConverter.safe_tuple_float(entity_data["corner1"])
         corner2 = CoordinateConverter.safe_tuple_float(entity_data["corner2"])
         
-        # Create 8 vertices of the box
+        # Corner coordinates of the box
         x1, y1, z1 = corner1[0], corner1[1], corner1[2] if len(corner1) > 2 else 0
         x2, y2, z2 = corner2[0], corner2[1], corner2[2] if len(corner2) > 2 else 0
         
-        vertices = [
-            (x1, y1, z1), (x2, y1, z1), (x2, y2, z1), (x1, y2, z1),  # bottom
-            (x1, y1, z2), (x2, y1, z2), (x2, y2, z2), (x1, y2, z2)   # top
-        ]
-        
-        # Create faces (simplified representation)
-        target.add_3dface([vertices[0], vertices[1], vertices[2], vertices[3]], dxfattribs=dxf_attribs)  # bottom
-        target.add_3dface([vertices[4], vertices[5], vertices[6], vertices[7]], dxfattribs=dxf_attribs)  # top
+        # Create faces (simplified representation), built directly as quads
+        target.add_3dface([(x1, y1, z1), (x2, y1, z1), (x2, y2, z1), (x1, y2, z1)], dxfattribs=dxf_attribs)  # bottom
+        target.add_3dface([(x1, y1, z2), (x2, y1, z2), (x2, y2, z2), (x1, y2, z2)], dxfattribs=dxf_attribs)  # top
         
-        logger.debug(f"Box solid processed successfully")
+        logger.debug("Box solid processed successfully")
         return True
     
     def _process_cylinder(self, entity_data: Dict[str, Any], target: Any, dxf_attribs: Dict[str, Any]) -> bool:
         """Process a cylinder solid (simplified as circle representation)."""
-        required_fields = ["center", "radius", "height"]
+        required_fields = ("center", "radius", "height")
         for field in required_fields:
             if field not in entity_data:
                 raise EntityProcessingError(f"Cylinder missing required '{field}' field")
@@ -836,12 +911,12 @@ class SolidProcessor(EntityProcessor):
         target.add_circle(center=base_center, radius=radius, dxfattribs=dxf_attribs)
         target.add_circle(center=top_center, radius=radius, dxfattribs=dxf_attribs)
         
-        logger.debug(f"Cylinder solid processed successfully")
+        logger.debug("Cylinder solid processed successfully")
         return True
     
     def _process_sphere(self, entity_data: Dict[str, Any], target: Any, dxf_attribs: Dict[str, Any]) -> bool:
         """Process a sphere solid (simplified as circle representation)."""
-        required_fields = ["center", "radius"]
+        required_fields = ("center", "radius")
         for field in required_fields:
             if field not in entity_data:
                 raise EntityProcessingError(f"Sphere missing required '{field}' field")
@@ -855,8 +930,14 @@ class SolidProcessor(EntityProcessor):
         # Create sphere as circle (simplified representation)
         target.add_circle(center=center, radius=radius, dxfattribs=dxf_attribs)
         
-        logger.debug(f"Sphere solid processed successfully")
+        logger.debug("Sphere solid processed successfully")
         return True
+    
+    _handlers = {
+        "box": _process_box,
+        "cylinder": _process_cylinder,
+        "sphere": _process_sphere,
+    }
 
 class MeshProcessor(EntityProcessor):
     """Processor for mesh/surface entities."""
@@ -878,12 +959,10 @@ class MeshProcessor(EntityProcessor):
                 raise EntityProcessingError(f"Mesh needs at least 1 face, got {len(faces)}")
             
             # Validate vertices
-            validated_vertices = []
-            for i, vertex in enumerate(vertices):
-                GeometryValidator.validate_point(vertex, min_coords=3)
-                validated_vertices.append(CoordinateConverter.safe_tuple_float(vertex))
+            validated_vertices = CoordinateConverter.validated_points(vertices, min_coords=3)
             
             # Create mesh as 3D faces
+            vertex_count = len(validated_vertices)
             for face_indices in faces:
                 if len(face_indices) < 3:
                     logger.warning(f"Skipping face with less than 3 vertices: {face_indices}")
@@ -891,7 +970,7 @@ class MeshProcessor(EntityProcessor):
                 
                 face_vertices = []
                 for idx in face_indices:
-                    if 0 <= idx < len(validated_vertices):
+                    if 0 <= idx < vertex_count:
                         face_vertices.append(validated_vertices[idx])
                     else:
                         logger.warning(f"Invalid vertex index: {idx}")
@@ -904,7 +983,7 @@ class MeshProcessor(EntityProcessor):
                     
                     target.add_3dface(face_vertices[:4], dxfattribs=dxf_attribs)
             
-            logger.debug(f"Mesh processed successfully with {len(validated_vertices)} vertices and {len(faces)} faces")
+            logger.debug("Mesh processed successfully with %s vertices and %s faces", len(validated_vertices), len(faces))
             return True
             
         except (ValidationError, EntityProcessingError) as e:
@@ -922,17 +1001,11 @@ class DimensionProcessor(EntityProcessor):
         try:
             dim_type = entity_data.get("dimension_type", "linear")
             
-            if dim_type == "linear":
-                return self._process_linear_dimension(entity_data, target, dxf_attribs)
-            elif dim_type == "angular":
-                return self._process_angular_dimension(entity_data, target, dxf_attribs)
-            elif dim_type == "radial":
-                return self._process_radial_dimension(entity_data, target, dxf_attribs)
-            elif dim_type == "diameter":
-                return self._process_diameter_dimension(entity_data, target, dxf_attribs)
-            else:
+            handler = self._handlers.get(dim_type)
+            if handler is None:
                 logger.warning(f"Unsupported dimension type: {dim_type}")
                 return False
+            return handler(self, entity_data, target, dxf_attribs)
                 
         except Exception as e:
             logger.error(f"Unexpected error processing dimension: {e}")
@@ -940,7 +1013,7 @@ class DimensionProcessor(EntityProcessor):
     
     def _process_linear_dimension(self, entity_data: Dict[str, Any], target: Any, dxf_attribs: Dict[str, Any]) -> bool:
         """Process linear dimension."""
-        required_fields = ["start", "end", "dimline_point"]
+        required_fields = ("start", "end", "dimline_point")
         for field in required_fields:
             if field not in entity_data:
                 raise EntityProcessingError(f"Linear dimension missing required '{field}' field")
@@ -970,12 +1043,12 @@ class DimensionProcessor(EntityProcessor):
         else:
             dim.render()
         
-        logger.debug(f"Linear dimension processed successfully")
+        logger.debug("Linear dimension processed successfully")
         return True
     
     def _process_radial_dimension(self, entity_data: Dict[str, Any], target: Any, dxf_attribs: Dict[str, Any]) -> bool:
         """Process radial dimension."""
-        required_fields = ["center", "radius_point"]
+        required_fields = ("center", "radius_point")
         for field in required_fields:
             if field not in entity_data:
                 raise EntityProcessingError(f"Radial dimension missing required '{field}' field")
@@ -993,8 +1066,14 @@ class DimensionProcessor(EntityProcessor):
         )
         dim.render()
         
-        logger.debug(f"Radial dimension processed successfully")
+        logger.debug("Radial dimension processed successfully")
         return True
+    
+    # Angular and diameter dimensions have no handler yet and are reported as unsupported
+    _handlers = {
+        "linear": _process_linear_dimension,
+        "radial": _process_radial_dimension,
+    }
 
 class LeaderProcessor(EntityProcessor):
     """Processor for leader/multileader entities."""
@@ -1010,10 +1089,7 @@ class LeaderProcessor(EntityProcessor):
                 raise EntityProcessingError(f"Leader needs at least 2 vertices, got {len(vertices)}")
             
             # Validate vertices
-            validated_vertices = []
-            for vertex in vertices:
-                GeometryValidator.validate_point(vertex)
-                validated_vertices.append(CoordinateConverter.safe_tuple_float(vertex))
+            validated_vertices = CoordinateConverter.validated_points(vertices)
             
             # Create leader as polyline with arrowhead
             leader = target.add_lwpolyline(validated_vertices, dxfattribs=dxf_attribs)
@@ -1029,13 +1105,12 @@ class LeaderProcessor(EntityProcessor):
                     dxfattribs={"height": text_height, **dxf_attribs}
                 )
                 text.dxf.insert = text_position
-                try:
+                if TEXT_HAS_SET_ALIGN:
                     text.set_align("LEFT")
-                except AttributeError:
-                    # Fallback for older ezdxf versions
+                else:
                     text.dxf.halign = 0  # LEFT align
             
-            logger.debug(f"Leader processed successfully with {len(validated_vertices)} vertices")
+            logger.debug("Leader processed successfully with %s vertices", len(validated_vertices))
             return True
             
         except (ValidationError, EntityProcessingError) as e:
@@ -1059,10 +1134,7 @@ class HatchProcessor(EntityProcessor):
                 raise EntityProcessingError(f"Hatch boundary needs at least 3 points, got {len(boundary)}")
             
             # Validate boundary points
-            validated_boundary = []
-            for point in boundary:
-                GeometryValidator.validate_point(point)
-                validated_boundary.append(CoordinateConverter.safe_tuple_float(point))
+            validated_boundary = CoordinateConverter.validated_points(boundary)
             
             pattern_name = entity_data.get("pattern", "SOLID")
             pattern_scale = float(entity_data.get("pattern_scale", 1.0))
@@ -1080,7 +1152,7 @@ class HatchProcessor(EntityProcessor):
             # Add boundary
             hatch.paths.add_polyline_path(validated_boundary, is_closed=True)
             
-            logger.debug(f"Hatch processed successfully with pattern '{pattern_name}'")
+            logger.debug("Hatch processed successfully with pattern '%s'", pattern_name)
             return True
             
         except (ValidationError, EntityProcessingError) as e:
@@ -1121,14 +1193,9 @@ class MTextProcessor(EntityProcessor):
             
             # Set alignment
             alignment = entity_data.get("alignment", "LEFT")
-            if alignment == "CENTER":
-                mtext.dxf.attachment_point = 5  # Middle center
-            elif alignment == "RIGHT":
-                mtext.dxf.attachment_point = 6  # Middle right
-            else:
-                mtext.dxf.attachment_point = 4  # Middle left
+            mtext.dxf.attachment_point = MTEXT_ATTACHMENT_POINTS.get(alignment, 4)  # Default middle left
             
-            logger.debug(f"MTEXT processed successfully")
+            logger.debug("MTEXT processed successfully")
             return True
             
         except (ValidationError, EntityProcessingError) as e:
@@ -1145,7 +1212,7 @@ class ViewportProcessor(EntityProcessor):
     def process(self, entity_data: Dict[str, Any], target: Any, dxf_attribs: Dict[str, Any]) -> bool:
         try:
             # Validate required fields
-            required_fields = ["center", "width", "height"]
+            required_fields = ("center", "width", "height")
             for field in required_fields:
                 if field not in entity_data:
                     raise EntityProcessingError(f"Viewport missing required '{field}' field")
@@ -1179,14 +1246,13 @@ class ViewportProcessor(EntityProcessor):
                     dxfattribs={"height": 100, **dxf_attribs}
                 )
                 label_text.dxf.insert = center
-                try:
+                if TEXT_HAS_SET_ALIGN:
                     label_text.set_align("MIDDLE_CENTER")
-                except AttributeError:
-                    # Fallback for older ezdxf versions
+                else:
                     label_text.dxf.halign = 1  # CENTER align
                     label_text.dxf.valign = 1  # MIDDLE align
             
-            logger.debug(f"Viewport processed successfully (center: {center}, size: {width}x{height})")
+            logger.debug("Viewport processed successfully (center: %s, size: %sx%s)", center, width, height)
             return True
             
         except (ValidationError, EntityProcessingError) as e:
@@ -1208,7 +1274,7 @@ class LinetypeProcessor(EntityProcessor):
             pattern = entity_data.get("linetype_pattern", [])
             
             # For now, just log the linetype definition
-            logger.debug(f"Linetype '{linetype_name}' defined with pattern: {pattern}")
+            logger.debug("Linetype '%s' defined with pattern: %s", linetype_name, pattern)
             
             # Apply linetype to subsequent entities by updating dxf_attribs
             if hasattr(target, 'doc'):  # If we have access to the document
@@ -1217,7 +1283,7 @@ class LinetypeProcessor(EntityProcessor):
                     if linetype_name not in target.doc.linetypes:
                         if pattern:
                             target.doc.linetypes.new(linetype_name, dxfattribs={'pattern': pattern})
-                        logger.debug(f"Custom linetype '{linetype_name}' created")
+                        logger.debug("Custom linetype '%s' created", linetype_name)
                 except Exception as e:
                     logger.warning(f"Could not create custom linetype: {e}")
             
@@ -1257,7 +1323,7 @@ class LayerStateProcessor(EntityProcessor):
                             layer.freeze()
                         if locked:
                             layer.lock()
-                        logger.debug(f"Layer state applied to '{layer_name}'")
+                        logger.debug("Layer state applied to '%s'", layer_name)
                     else:
                         logger.warning(f"Layer '{layer_name}' not found for state management")
                 except Exception as e:
@@ -1279,13 +1345,11 @@ class AttributeProcessor(EntityProcessor):
         try:
             attr_type = entity_data.get("attribute_type", "definition")
             
-            if attr_type == "definition":
-                return self._process_attribute_definition(entity_data, target, dxf_attribs)
-            elif attr_type == "value":
-                return self._process_attribute_value(entity_data, target, dxf_attribs)
-            else:
+            handler = self._handlers.get(attr_type)
+            if handler is None:
                 logger.warning(f"Unknown attribute type: {attr_type}")
                 return False
+            return handler(self, entity_data, target, dxf_attribs)
                 
         except Exception as e:
             logger.error(f"Error processing attribute: {e}")
@@ -1293,7 +1357,7 @@ class AttributeProcessor(EntityProcessor):
     
     def _process_attribute_definition(self, entity_data: Dict[str, Any], target: Any, dxf_attribs: Dict[str, Any]) -> bool:
         """Process attribute definition."""
-        required_fields = ["tag", "position"]
+        required_fields = ("tag", "position")
         for field in required_fields:
             if field not in entity_data:
                 raise EntityProcessingError(f"Attribute definition missing required '{field}' field")
@@ -1312,14 +1376,17 @@ class AttributeProcessor(EntityProcessor):
             dxfattribs={"height": height, **dxf_attribs}
         )
         attr_text.dxf.insert = position
-        attr_text.set_align("LEFT")
+        if TEXT_HAS_SET_ALIGN:
+            attr_text.set_align("LEFT")
+        else:
+            attr_text.dxf.halign = 0  # LEFT align
         
-        logger.debug(f"Attribute definition processed: {tag}")
+        logger.debug("Attribute definition processed: %s", tag)
         return True
     
     def _process_attribute_value(self, entity_data: Dict[str, Any], target: Any, dxf_attribs: Dict[str, Any]) -> bool:
         """Process attribute value insertion."""
-        required_fields = ["tag", "value", "position"]
+        required_fields = ("tag", "value", "position")
         for field in required_fields:
             if field not in entity_data:
                 raise EntityProcessingError(f"Attribute value missing required '{field}' field")
@@ -1337,10 +1404,18 @@ class AttributeProcessor(EntityProcessor):
             dxfattribs={"height": height, **dxf_attribs}
         )
         attr_text.dxf.insert = position
-        attr_text.set_align("LEFT")
+        if TEXT_HAS_SET_ALIGN:
+            attr_text.set_align("LEFT")
+        else:
+            attr_text.dxf.halign = 0  # LEFT align
         
-        logger.debug(f"Attribute value processed: {tag}={value}")
+        logger.debug("Attribute value processed: %s=%s", tag, value)
         return True
+    
+    _handlers = {
+        "definition": _process_attribute_definition,
+        "value": _process_attribute_value,
+    }
 
 # Phase 3D: Coordinate Systems & Transforms
 class CoordinateSystemProcessor(EntityProcessor):
@@ -1350,17 +1425,11 @@ class CoordinateSystemProcessor(EntityProcessor):
         try:
             transform_type = entity_data.get("transform_type", "translate")
             
-            if transform_type == "translate":
-                return self._process_translation(entity_data, target, dxf_attribs)
-            elif transform_type == "rotate":
-                return self._process_rotation(entity_data, target, dxf_attribs)
-            elif transform_type == "scale":
-                return self._process_scaling(entity_data, target, dxf_attribs)
-            elif transform_type == "ucs":
-                return self._process_ucs_definition(entity_data, target, dxf_attribs)
-            else:
+            handler = self._handlers.get(transform_type)
+            if handler is None:
                 logger.warning(f"Unknown transform type: {transform_type}")
                 return False
+            return handler(self, entity_data, target, dxf_attribs)
                 
         except Exception as e:
             logger.error(f"Error processing coordinate system: {e}")
@@ -1406,12 +1475,12 @@ class CoordinateSystemProcessor(EntityProcessor):
             target.add_line(end, arrow1, dxfattribs=dxf_attribs)
             target.add_line(end, arrow2, dxfattribs=dxf_attribs)
         
-        logger.debug(f"Translation processed: offset {offset}")
+        logger.debug("Translation processed: offset %s", offset)
         return True
     
     def _process_ucs_definition(self, entity_data: Dict[str, Any], target: Any, dxf_attribs: Dict[str, Any]) -> bool:
         """Process UCS definition."""
-        required_fields = ["origin", "x_axis", "y_axis"]
+        required_fields = ("origin", "x_axis", "y_axis")
         for field in required_fields:
             if field not in entity_data:
                 raise EntityProcessingError(f"UCS definition missing required '{field}' field")
@@ -1441,8 +1510,14 @@ class CoordinateSystemProcessor(EntityProcessor):
         target.add_text("X", dxfattribs={"height": 50, **x_attribs}).dxf.insert = x_end
         target.add_text("Y", dxfattribs={"height": 50, **y_attribs}).dxf.insert = y_end
         
-        logger.debug(f"UCS defined at origin {origin}")
+        logger.debug("UCS defined at origin %s", origin)
         return True
+    
+    # Rotation and scaling have no handler yet and are reported as unsupported
+    _handlers = {
+        "translate": _process_translation,
+        "ucs": _process_ucs_definition,
+    }
 
 # Entity Factory
 class EntityFactory:
@@ -1497,6 +1572,7 @@ class DXFGenerator:
         self.doc = None
         self.msp = None
         self.summary = None
+        self._dxf_attribs_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
         
     def generate_from_instructions(self, data: Dict[str, Any]) -> Tuple[str, ProcessingSummary]:
         """
@@ -1518,18 +1594,9 @@ class DXFGenerator:
             # Use temp file manager for better cleanup
             filepath = temp_file_manager.create_temp_file(".dxf")
             
-            logger.info(f"Starting DXF generation: {filepath}")
-            
-            # Initialize DXF document
-            self._initialize_document()
-            
-            # Process layers, blocks, and figures with summary tracking
-            self._process_layers(data.get("layers", []))
-            self._process_blocks(data.get("blocks", []))
-            self._process_figures(data.get("figures", []))
+            logger.info("Starting DXF generation: %s", filepath)
             
-            # Add layout elements
-            self._add_layout_elements()
+            self._build_document(data)
             
             # Save document
             self.doc.saveas(filepath)
@@ -1538,22 +1605,78 @@ class DXFGenerator:
             # Finalize summary
             self.summary.finalize(filepath, file_size)
             
-            logger.info(f"DXF generation completed: {self.summary.successful_entities}/{self.summary.total_entities} entities processed")
+            logger.info("DXF generation completed: %s/%s entities processed", self.summary.successful_entities, self.summary.total_entities)
             
             return filepath, self.summary
             
         except Exception as e:
-            if self.summary:
-                self.summary.errors.append(f"Generation failed: {str(e)}")
-                self.summary.end_time = datetime.now()
-            logger.error(f"DXF generation failed: {e}", exc_info=True)
-            raise DXFGenerationError(f"Failed to generate DXF: {e}") from e
+            raise self._generation_failed(e) from e
+    
+    def generate_bytes_from_instructions(self, data: Dict[str, Any], filename: str) -> Tuple[bytes, ProcessingSummary]:
+        """
+        Generate DXF content in memory from structured instructions.
+        
+        Same as generate_from_instructions, but the document is encoded
+        straight to bytes instead of being saved to a temp file.
+        
+        Args:
+            data: Dictionary containing DXF generation instructions
+            filename: Name reported in the processing summary
+            
+        Returns:
+            Tuple[bytes, ProcessingSummary]: DXF file content and processing summary
+            
+        Raises:
+            DXFGenerationError: If DXF generation fails
+        """
+        self.summary = ProcessingSummary()
+        
+        try:
+            logger.info("Starting in-memory DXF generation: %s", filename)
+            
+            self._build_document(data)
+            
+            # Encode document the same way saveas writes it
+            stream = io.StringIO()
+            self.doc.write(stream)
+            content = self.doc.encode(stream.getvalue())
+            
+            self.summary.finalize(filename, len(content))
+            
+            logger.info("DXF generation completed: %s/%s entities processed", self.summary.successful_entities, self.summary.total_entities)
+            
+            return content, self.summary
+            
+        except Exception as e:
+            raise self._generation_failed(e) from e
+    
+    def _build_document(self, data: Dict[str, Any]):
+        """Create the DXF document and add all instructed content."""
+        # Initialize DXF document
+        self._initialize_document()
+        
+        # Process layers, blocks, and figures with summary tracking
+        self._process_layers(data.get("layers", []))
+        self._process_blocks(data.get("blocks", []))
+        self._process_figures(data.get("figures", []))
+        
+        # Add layout elements
+        self._add_layout_elements()
+    
+    def _generation_failed(self, error: Exception) -> DXFGenerationError:
+        """Record a generation failure in the summary and wrap it for raising."""
+        if self.summary:
+            self.summary.errors.append(f"Generation failed: {str(error)}")
+            self.summary.end_time = datetime.now()
+        logger.error(f"DXF generation failed: {error}", exc_info=True)
+        return DXFGenerationError(f"Failed to generate DXF: {error}")
     
     def _initialize_document(self):
         """Initialize the DXF document."""
         self.doc = ezdxf.new(dxfversion="R2010")
         self.doc.header['$INSUNITS'] = 4
         self.msp = self.doc.modelspace()
+        self._dxf_attribs_cache = {}
         logger.debug("DXF document initialized")
     
     def _process_layers(self, layers: List[Dict[str, Any]]):
@@ -1564,7 +1687,7 @@ class DXFGenerator:
                     name=layer["name"], 
                     dxfattribs={"color": layer.get("color", 7)}
                 )
-                logger.debug(f"Layer processed: {layer['name']}")
+                logger.debug("Layer processed: %s", layer['name'])
             except Exception as e:
                 logger.error(f"Error processing layer '{layer.get('name', '')}': {e}")
     
@@ -1573,7 +1696,7 @@ class DXFGenerator:
         for block in blocks:
             try:
                 block_def = self.doc.blocks.new(name=block["name"])
-                logger.debug(f"Processing block: {block['name']}")
+                logger.debug("Processing block: %s", block['name'])
                 
                 for entity in block.get("entities", []):
                     self._process_entity(entity, block_def)
@@ -1609,11 +1732,15 @@ class DXFGenerator:
                 self.summary.add_entity_result(entity_type, layer, False, message)
             return
         
-        # Prepare DXF attributes
-        dxf_attribs = {
-            "layer": layer,
-            "color": int(entity_data.get("color", 7))
-        }
+        # Prepare DXF attributes, shared by entities with the same layer and
+        # color (processors and ezdxf only ever copy this dict)
+        attribs_key = (layer, int(entity_data.get("color", 7)))
+        dxf_attribs = self._dxf_attribs_cache.get(attribs_key)
+        if dxf_attribs is None:
+            dxf_attribs = self._dxf_attribs_cache[attribs_key] = {
+                "layer": layer,
+                "color": attribs_key[1]
+            }
         
         # Process the entity with summary tracking
         try:
@@ -1637,13 +1764,14 @@ class DXFGenerator:
         layout_text.dxf.insert = (10, 20)
 
 # Main function remains the same but uses the new architecture
-def handle_template_request(req: Any, res: Any) -> Any:
+def handle_template_request(req: Any, res: Any, body: Optional[Dict[str, Any]] = None) -> Any:
     """
     Handle template-based kitchen generation for Agent Zero.
     
     Args:
         req: Request object from Appwrite
         res: Response object from Appwrite
+        body: Parsed JSON body, decoded from req.body_raw when not given
         
     Returns:
         Binary DXF file or JSON response
@@ -1652,9 +1780,11 @@ def handle_template_request(req: Any, res: Any) -> Any:
         return res.json({"error": "Template engine not available"}, 503)
     
     try:
-        body = json.loads(req.body_raw)
+        if body is None:
+            body = _json_loads(req.body_raw)
         logger.info("Template-based DXF generation request received")
-        logger.debug(f"Template request: {json.dumps(body, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Template request: %s", json.dumps(body, indent=2))
         
         # Validate template request
         try:
@@ -1665,7 +1795,7 @@ def handle_template_request(req: Any, res: Any) -> Any:
             return res.json({"error": f"Invalid template request format: {ve.errors()}"}, 400)
         
         # Initialize template engine
-        engine = KitchenTemplateEngine()
+        engine = get_template_engine()
         
         # Get and customize template
         try:
@@ -1697,8 +1827,10 @@ def handle_template_request(req: Any, res: Any) -> Any:
             dxf_instructions["client_info"] = validated_request.client_info
         
         # Generate DXF using existing engine
+        safe_template_name = validated_request.template_name.translate(FILENAME_SANITIZE_TABLE)
+        filename = f"kitchen_{safe_template_name}_{os.urandom(4).hex()}.dxf"
         generator = DXFGenerator()
-        dxf_path, processing_summary = generator.generate_from_instructions(dxf_instructions)
+        file_content, processing_summary = generator.generate_bytes_from_instructions(dxf_instructions, filename)
         
         # Add template info to summary
         processing_summary.template_info = {
@@ -1710,45 +1842,33 @@ def handle_template_request(req: Any, res: Any) -> Any:
         
         # Check if client wants detailed summary instead of file
         if validated_request.return_summary:
-            temp_file_manager.cleanup_file(dxf_path)
             summary_dict = processing_summary.to_dict()
             summary_dict["template_info"] = processing_summary.template_info
             return res.json(summary_dict, 200)
         
         # Return DXF file with template processing info in headers
-        file_size = os.path.getsize(dxf_path)
+        headers = {
+            "Content-Type": "application/dxf",
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Processing-Summary": _header_json(processing_summary.to_dict()),
+            "X-Template-Info": _header_json(processing_summary.template_info)
+        }
         
-        try:
-            with open(dxf_path, "rb") as f:
-                file_content = f.read()
-            
-            temp_file_manager.cleanup_file(dxf_path)
-            
-            headers = {
-                "Content-Type": "application/dxf",
-                "Content-Disposition": f'attachment; filename="kitchen_{validated_request.template_name}_{uuid.uuid4().hex[:8]}.dxf"',
-                "X-Processing-Summary": json.dumps(processing_summary.to_dict()),
-                "X-Template-Info": json.dumps(processing_summary.template_info)
-            }
-            
-            logger.info(f"Template DXF generated successfully: {file_size} bytes using '{validated_request.template_name}' template")
-            return res.send(file_content, 200, headers)
-            
-        except Exception as e:
-            temp_file_manager.cleanup_file(dxf_path)
-            raise e
+        logger.info("Template DXF generated successfully: %s bytes using '%s' template", len(file_content), validated_request.template_name)
+        return res.send(file_content, 200, headers)
             
     except Exception as e:
         logger.error(f"Template processing error: {e}", exc_info=True)
         return res.json({"error": f"Template processing failed: {str(e)}"}, 500)
 
-def handle_legacy_semantic_request(req: Any, res: Any) -> Any:
+def handle_legacy_semantic_request(req: Any, res: Any, body: Optional[Dict[str, Any]] = None) -> Any:
     """
     Handle legacy semantic requests by converting to template-based approach.
     
     Args:
         req: Request object from Appwrite
         res: Response object from Appwrite
+        body: Parsed JSON body, decoded from req.body_raw when not given
         
     Returns:
         Binary DXF file or JSON response
@@ -1757,7 +1877,8 @@ def handle_legacy_semantic_request(req: Any, res: Any) -> Any:
         return res.json({"error": "Template engine not available"}, 503)
     
     try:
-        body = json.loads(req.body_raw)
+        if body is None:
+            body = _json_loads(req.body_raw)
         logger.info("Legacy semantic request received - converting to template-based")
         
         # Validate legacy request
@@ -1768,7 +1889,7 @@ def handle_legacy_semantic_request(req: Any, res: Any) -> Any:
             return res.json({"error": f"Invalid request format: {ve.errors()}"}, 400)
         
         # Initialize template engine
-        engine = KitchenTemplateEngine()
+        engine = get_template_engine()
         
         # Translate German terms if present
         description = engine.translate_german_terms(validated_request.description)
@@ -1777,9 +1898,10 @@ def handle_legacy_semantic_request(req: Any, res: Any) -> Any:
         template_name = "modern_l_shaped"  # Default
         customization = {}
         
+        description_lower = description.lower()
+        
         # Extract dimensions using simple pattern matching
-        import re
-        dim_match = re.search(r'(\d+(?:\.\d+)?)x(\d+(?:\.\d+)?)', description.lower())
+        dim_match = LEGACY_DIMENSIONS_RE.search(description_lower)
         if dim_match:
             width = float(dim_match.group(1)) * 1000  # Convert to mm
             height = float(dim_match.group(2)) * 1000
@@ -1793,18 +1915,18 @@ def handle_legacy_semantic_request(req: Any, res: Any) -> Any:
                 template_name = "u_shaped_luxury"
         
         # Extract style
-        if "traditional" in description.lower() or "country" in description.lower():
+        if "traditional" in description_lower or "country" in description_lower:
             customization["style"] = "traditional"
             if template_name == "modern_l_shaped":
                 template_name = "traditional_country"
-        elif "open" in description.lower():
+        elif "open" in description_lower:
             template_name = "open_plan_modern"
         
         # Extract appliances
         appliances = []
-        if "island" in description.lower():
+        if "island" in description_lower:
             appliances.append("island")
-        if "dishwasher" in description.lower():
+        if "dishwasher" in description_lower:
             appliances.append("dishwasher")
         if appliances:
             customization["appliances"] = appliances
@@ -1817,16 +1939,9 @@ def handle_legacy_semantic_request(req: Any, res: Any) -> Any:
             "client_info": validated_request.client_info or {"legacy_semantic": True}
         }
         
-        # Create mock request object for template handler
-        class MockRequest:
-            def __init__(self, body_data):
-                self.body_raw = json.dumps(body_data)
-        
-        mock_req = MockRequest(template_request)
-        
         # Process using template handler
-        logger.info(f"Converted legacy semantic to template: {template_name} with customization: {customization}")
-        return handle_template_request(mock_req, res)
+        logger.info("Converted legacy semantic to template: %s with customization: %s", template_name, customization)
+        return handle_template_request(req, res, template_request)
         
     except Exception as e:
         logger.error(f"Legacy semantic processing error: {e}", exc_info=True)
@@ -1851,24 +1966,31 @@ def main(context: Any) -> Any:
     req = context.req
     res = context.res
 
+    # Empty or whitespace-only bodies can never parse; skip the decoder and error log.
+    # isspace() stops at the first non-whitespace character, so JSON bodies are not copied
+    body_raw = req.body_raw
+    if not body_raw or body_raw.isspace():
+        logger.debug("Empty request body")
+        return res.json(EMPTY_BODY_RESPONSE, 400)
+
     # Simple routing based on request content
     try:
-        body = json.loads(req.body_raw)
+        body = _json_loads(body_raw)
         
         # Check for Agent Zero equipment specification (has 'objects' array)
         if "objects" in body and isinstance(body["objects"], list):
             logger.info("Routing to Agent Zero equipment specification")
-            return handle_equipment_specification_request(req, res)
+            return handle_equipment_specification_request(req, res, body)
         
         # Check for template-based request (has 'template_name' field)
         elif "template_name" in body and isinstance(body["template_name"], str):
             logger.info("Routing to template-based generation")
-            return handle_template_request(req, res)
+            return handle_template_request(req, res, body)
         
         # Check for legacy semantic request (has 'description' field)
         elif "description" in body and isinstance(body["description"], str):
             logger.info("Routing to legacy semantic endpoint")
-            return handle_legacy_semantic_request(req, res)
+            return handle_legacy_semantic_request(req, res, body)
         
         # Traditional DXF generation
         else:
@@ -1882,7 +2004,7 @@ def main(context: Any) -> Any:
         logger.error(f"Unexpected routing error: {e}", exc_info=True)
         return res.json({"error": "Internal server error"}, 500)
 
-def handle_equipment_specification_request(req: Any, res: Any) -> Any:
+def handle_equipment_specification_request(req: Any, res: Any, body: Optional[Dict[str, Any]] = None) -> Any:
     """
     Handle Agent Zero's equipment specification format.
     Converts kitchen equipment list to professional CAD layout.
@@ -1890,13 +2012,15 @@ def handle_equipment_specification_request(req: Any, res: Any) -> Any:
     Args:
         req: Request object containing equipment specification
         res: Response object
+        body: Parsed JSON body, decoded from req.body_raw when not given
         
     Returns:
         Binary DXF file or JSON response
     """
     try:
-        body = json.loads(req.body_raw)
-        logger.info(f"Equipment specification request with {len(body.get('objects', []))} objects")
+        if body is None:
+            body = _json_loads(req.body_raw)
+        logger.info("Equipment specification request with %s objects", len(body.get('objects', [])))
 
         # Validate using Pydantic model
         try:
@@ -1909,33 +2033,21 @@ def handle_equipment_specification_request(req: Any, res: Any) -> Any:
         
         # Generate DXF using the enhanced class-based architecture
         generator = DXFGenerator()
-        dxf_path, processing_summary = generator.generate_from_instructions(dxf_data)
+        file_content, processing_summary = generator.generate_bytes_from_instructions(dxf_data, "kitchen_equipment_layout.dxf")
 
         # Check if client wants detailed summary instead of file
         if validated_request.return_summary:
-            temp_file_manager.cleanup_file(dxf_path)
             return res.json(processing_summary.to_dict(), 200)
 
         # Return DXF file
-        file_size = os.path.getsize(dxf_path)
-        try:
-            with open(dxf_path, "rb") as f:
-                file_content = f.read()
-            
-            temp_file_manager.cleanup_file(dxf_path)
-            
-            headers = {
-                "Content-Type": "application/dxf",
-                "Content-Disposition": 'attachment; filename="kitchen_equipment_layout.dxf"',
-                "X-Processing-Summary": json.dumps(processing_summary.to_dict())
-            }
-            
-            logger.info(f"Equipment layout DXF generated successfully ({file_size} bytes)")
-            return res.send(file_content, 200, headers)
-            
-        except Exception as e:
-            temp_file_manager.cleanup_file(dxf_path)
-            raise e
+        headers = {
+            "Content-Type": "application/dxf",
+            "Content-Disposition": 'attachment; filename="kitchen_equipment_layout.dxf"',
+            "X-Processing-Summary": _header_json(processing_summary.to_dict())
+        }
+        
+        logger.info("Equipment layout DXF generated successfully (%s bytes)", len(file_content))
+        return res.send(file_content, 200, headers)
 
     except Exception as e:
         logger.error(f"Equipment specification processing error: {e}", exc_info=True)
@@ -1952,7 +2064,7 @@ def convert_equipment_to_dxf(objects: List[Dict[str, Any]]) -> Dict[str, Any]:
     Returns:
         DXF instruction dictionary compatible with DXFGenerator
     """
-    logger.info(f"Converting {len(objects)} equipment objects to DXF layout")
+    logger.info("Converting %s equipment objects to DXF layout", len(objects))
     
     # Create layers for different equipment types
     layers = [
@@ -2028,7 +2140,7 @@ def convert_equipment_to_dxf(objects: List[Dict[str, Any]]) -> Dict[str, Any]:
             current_x += width + 500  # 0.5m gap between items
             row_height = max(row_height, depth)
             
-            logger.debug(f"Processed equipment {i+1}: {name} ({width}x{depth}mm)")
+            logger.debug("Processed equipment %s: %s (%sx%smm)", i+1, name, width, depth)
             
         except Exception as e:
             logger.warning(f"Failed to process equipment object {i+1}: {e}")
@@ -2055,7 +2167,7 @@ def convert_equipment_to_dxf(objects: List[Dict[str, Any]]) -> Dict[str, Any]:
         "blocks": []  # No blocks needed for equipment layout
     }
     
-    logger.info(f"Generated DXF layout with {len(figures)} entities")
+    logger.info("Generated DXF layout with %s entities", len(figures))
     return dxf_data
 
 
@@ -2073,7 +2185,8 @@ def handle_traditional_dxf_request(req: Any, res: Any, body: Dict[str, Any]) ->
     """
     try:
         logger.info("Traditional DXF generation request received")
-        logger.debug(f"Request body: {json.dumps(body, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request body: %s", json.dumps(body, indent=2))
 
         # Step 4: Apply request validation middleware
         validation_error, processed_body = RequestValidator.validate_and_preprocess(body)
@@ -2083,74 +2196,55 @@ def handle_traditional_dxf_request(req: Any, res: Any, body: Dict[str, Any]) ->
 
         # Validate request using Pydantic model
         try:
-            validated_data = DXFRequestModel(**processed_body)
+            validated_data = DXFRequestModel.model_validate(processed_body)
             logger.info("Request validation successful")
         except PydanticValidationError as ve:
             logger.warning(f"Pydantic validation failed: {ve.errors()}")
             return res.json({"error": f"Invalid request format: {ve.errors()}"}, 400)
 
         # Generate DXF using the enhanced class-based architecture
+        filename = f"dxf_{os.urandom(4).hex()}.dxf"
         generator = DXFGenerator()
-        dxf_path, processing_summary = generator.generate_from_instructions(validated_data.dict())
+        file_content, processing_summary = generator.generate_bytes_from_instructions(validated_data.model_dump(), filename)
 
         # Check if client wants detailed summary instead of file
         request_summary = body.get("return_summary", False)
         if request_summary:
             # Return processing summary as JSON
-            temp_file_manager.cleanup_file(dxf_path)  # Clean up since we're not returning the file
             return res.json(processing_summary.to_dict(), 200)
 
         # Check file size for streaming decision
-        file_size = os.path.getsize(dxf_path)
+        file_size = len(file_content)
         use_streaming = file_size > 1024 * 1024  # Stream files larger than 1MB
         
-        try:
-            if use_streaming:
-                # Implement streaming for large files
-                logger.info(f"Streaming large DXF file: {os.path.basename(dxf_path)} ({file_size} bytes)")
-                
-                def generate_file_chunks():
-                    try:
-                        with open(dxf_path, "rb") as f:
-                            while True:
-                                chunk = f.read(8192)  # 8KB chunks
-                                if not chunk:
-                                    break
-                                yield chunk
-                    finally:
-                        # Cleanup after streaming
-                        temp_file_manager.cleanup_file(dxf_path)
-                
-                # Return streaming response
-                headers = {
-                    "Content-Type": "application/dxf",
-                    "Content-Disposition": f'attachment; filename="{os.path.basename(dxf_path)}"',
-                    "Content-Length": str(file_size),
-                    "X-Processing-Summary": json.dumps(processing_summary.to_dict())
-                }
-                return res.send(generate_file_chunks(), 200, headers)
-                
-            else:
-                # Regular response for smaller files
-                with open(dxf_path, "rb") as f:
-                    file_content = f.read()
-                
-                # Cleanup temp file
-                temp_file_manager.cleanup_file(dxf_path)
-                
-                headers = {
-                    "Content-Type": "application/dxf",
-                    "Content-Disposition": f'attachment; filename="{os.path.basename(dxf_path)}"',
-                    "X-Processing-Summary": json.dumps(processing_summary.to_dict())
-                }
-                
-                logger.info(f"DXF file returned successfully: {os.path.basename(dxf_path)} ({file_size} bytes)")
-                return res.send(file_content, 200, headers)
-                
-        except Exception as e:
-            # Ensure cleanup on error
-            temp_file_manager.cleanup_file(dxf_path)
-            raise e
+        if use_streaming:
+            # Implement streaming for large files
+            logger.info("Streaming large DXF file: %s (%s bytes)", filename, file_size)
+            
+            def generate_file_chunks():
+                view = memoryview(file_content)
+                for offset in range(0, file_size, 8192):  # 8KB chunks
+                    yield bytes(view[offset:offset + 8192])
+            
+            # Return streaming response
+            headers = {
+                "Content-Type": "application/dxf",
+                "Content-Disposition": f'attachment; filename="{filename}"',
+                "Content-Length": str(file_size),
+                "X-Processing-Summary": _header_json(processing_summary.to_dict())
+            }
+            return res.send(generate_file_chunks(), 200, headers)
+            
+        else:
+            # Regular response for smaller files
+            headers = {
+                "Content-Type": "application/dxf",
+                "Content-Disposition": f'attachment; filename="{filename}"',
+                "X-Processing-Summary": _header_json(processing_summary.to_dict())
+            }
+            
+            logger.info("DXF file returned successfully: %s (%s bytes)", filename, file_size)
+            return res.send(file_content, 200, headers)
 
     except DXFGenerationError as e:
         logger.error(f"DXF generation error: {e}")
@@ -41,7 +41,7 @@ class TemplateCustomizer:
         Returns:
             Scaled template with adjusted coordinates
         """
-        logger.info(f"Scaling template to dimensions: {width}x{height}mm")
+        logger.info("Scaling template to dimensions: %sx%smm", width, height)
         
         # Create deep copy to avoid modifying original
         scaled_template = copy.deepcopy(template)
@@ -54,7 +54,7 @@ class TemplateCustomizer:
         width_scale = width / original_width
         height_scale = height / original_height
         
-        logger.info(f"Scaling factors: width={width_scale:.2f}, height={height_scale:.2f}")
+        logger.info("Scaling factors: width=%.2f, height=%.2f", width_scale, height_scale)
         
         # Update template dimensions
         scaled_template["parameters"]["applied_dimensions"] = [width, height]
@@ -90,7 +90,7 @@ class TemplateCustomizer:
         Returns:
             Template with additional appliances added
         """
-        logger.info(f"Adding appliances: {appliances}")
+        logger.info("Adding appliances: %s", appliances)
         
         modified_template = copy.deepcopy(template)
         
@@ -128,7 +128,7 @@ class TemplateCustomizer:
         Returns:
             Template with style modifications applied
         """
-        logger.info(f"Applying style modifications: {style}")
+        logger.info("Applying style modifications: %s", style)
         
         styled_template = copy.deepcopy(template)
         
@@ -18,6 +18,8 @@ from main import (
     TempFileManager, GeometryValidator, CoordinateConverter,
     ValidationError, EntityProcessingError, DXFGenerationError
 )
+from agent_zero_helpers import AgentZeroHelpers
+from kitchen_template_engine import KitchenTemplateEngine
 
 class TestGeometryValidator:
     """Test geometric parameter validation."""
@@ -102,6 +104,41 @@ class TestCoordinateConverter:
         """Test invalid coordinate conversion fallback."""
         result = CoordinateConverter.safe_tuple_float([1, "invalid", 3])
         assert result == (1, "invalid", 3)  # Returns original on error
+    
+    def test_safe_tuple_float_fast_path(self):
+        """Test 2D/3D unpacking and the generic path give float tuples."""
+        assert CoordinateConverter.safe_tuple_float([1, 2]) == (1.0, 2.0)
+        assert CoordinateConverter.safe_tuple_float((1, "2.5", 3)) == (1.0, 2.5, 3.0)
+        assert CoordinateConverter.safe_tuple_float([1, 2, 3, 4]) == (1.0, 2.0, 3.0, 4.0)
+        assert CoordinateConverter.safe_tuple_float([]) == ()
+        assert all(type(v) is float for v in CoordinateConverter.safe_tuple_float([1, 2]))
+        assert CoordinateConverter.safe_tuple_float([1, None]) == (1, None)
+        assert CoordinateConverter.safe_tuple_float(("x", 2, 3)) == ("x", 2, 3)
+    
+    def test_validated_points_valid(self):
+        """Test point lists are validated and converted to float tuples."""
+        assert CoordinateConverter.validated_points([[0, 0], (1, "2")]) == [(0.0, 0.0), (1.0, 2.0)]
+        assert CoordinateConverter.validated_points([[0, 0, 0], [1, 2, 3]], min_coords=3) == [
+            (0.0, 0.0, 0.0), (1.0, 2.0, 3.0)]
+        assert CoordinateConverter.validated_points([[0, 0, 5], [1, 2]]) == [(0.0, 0.0, 5.0), (1.0, 2.0)]
+        assert CoordinateConverter.validated_points([]) == []
+    
+    @pytest.mark.parametrize("points,min_coords,message", [
+        ([[0, 0], [1]], 2, "at least 2 coordinates"),
+        ([[0, 0], [1, 2]], 3, "at least 3 coordinates"),
+        ([[0, 0], "1,2"], 2, "must be a list/tuple"),
+        ([[0, 0], None], 2, "must be a list/tuple"),
+        ([[0, 0], [1, "abc"]], 2, "Invalid coordinate values"),
+        ([[0, 0], [1, None]], 2, "Invalid coordinate values"),
+        ([[0, 0], []], 2, "at least 2 coordinates"),
+    ])
+    def test_validated_points_invalid(self, points, min_coords, message):
+        """Test invalid points raise the same errors as validate_point."""
+        with pytest.raises(ValidationError, match=message):
+            CoordinateConverter.validated_points(points, min_coords)
+        with pytest.raises(ValidationError, match=message):
+            for point in points:
+                GeometryValidator.validate_point(point, min_coords)
 
 
 class TestRequestValidator:
@@ -391,6 +428,45 @@ class TestDXFGenerator:
             if os.path.exists(dxf_path):
                 os.unlink(dxf_path)
 
+    def test_generate_bytes_matches_file_output(self):
+        """Test in-memory generation produces the same DXF content as the file path."""
+        import io
+        import ezdxf
+        
+        data = {
+            "layers": [{"name": "Walls", "color": 7}, {"name": "Text", "color": 4}],
+            "figures": [
+                {"type": "rectangle", "points": [[0, 0], [4000, 0], [4000, 3000], [0, 3000]], "layer": "Walls"},
+                {"type": "circle", "center": [2000, 1500], "radius": 300, "layer": "Walls"},
+                {"type": "line", "start": [0, 0], "end": [4000, 3000], "layer": "Walls"},
+                {"type": "text", "text": "Küche", "position": [100, 100], "height": 50, "layer": "Text"},
+                {"type": "polyline", "points": [[0, 0, 0], [1, 1, 1], [2, 0, 1]], "layer": "Walls"},
+                {"type": "unsupported_type", "layer": "Walls"}
+            ]
+        }
+        
+        dxf_path, file_summary = DXFGenerator().generate_from_instructions(data)
+        try:
+            file_doc = ezdxf.readfile(dxf_path)
+        finally:
+            os.unlink(dxf_path)
+        
+        content, bytes_summary = DXFGenerator().generate_bytes_from_instructions(data, "test.dxf")
+        bytes_doc = ezdxf.read(io.StringIO(content.decode(file_doc.encoding)))
+        
+        for layout in ("modelspace", "paperspace"):
+            file_entities = list(getattr(file_doc, layout)())
+            bytes_entities = list(getattr(bytes_doc, layout)())
+            assert len(bytes_entities) == len(file_entities)
+            assert [e.dxftype() for e in bytes_entities] == [e.dxftype() for e in file_entities]
+        assert sorted(l.dxf.name for l in bytes_doc.layers) == sorted(l.dxf.name for l in file_doc.layers)
+        
+        for counter in ("total_entities", "successful_entities", "failed_entities",
+                        "entities_by_type", "entities_by_layer", "errors"):
+            assert getattr(bytes_summary, counter) == getattr(file_summary, counter)
+        assert bytes_summary.file_info["size_bytes"] == len(content)
+        assert bytes_summary.file_info["path"] == "test.dxf"
+
 
 class TestAdvancedEntities:
     """Test advanced entity processing."""
@@ -485,6 +561,42 @@ class TestAdvancedEntities:
             if os.path.exists(dxf_path):
                 os.unlink(dxf_path)
 
+    def test_attribute_processing(self):
+        """Test attribute definition and value processing."""
+        generator = DXFGenerator()
+        data = {
+            "layers": [{"name": "TestLayer", "color": 7}],
+            "figures": [
+                {
+                    "type": "attribute",
+                    "attribute_type": "definition",
+                    "tag": "ROOM",
+                    "position": [0, 0],
+                    "default_value": "Kitchen",
+                    "layer": "TestLayer"
+                },
+                {
+                    "type": "attribute",
+                    "attribute_type": "value",
+                    "tag": "AREA",
+                    "value": "12 m2",
+                    "position": [0, 300],
+                    "layer": "TestLayer"
+                }
+            ]
+        }
+
+        dxf_path, summary = generator.generate_from_instructions(data)
+
+        try:
+            assert os.path.exists(dxf_path)
+            assert summary.successful_entities == 2
+            assert summary.failed_entities == 0
+
+        finally:
+            if os.path.exists(dxf_path):
+                os.unlink(dxf_path)
+
 
 class TestIntegration:
     """Integration tests with real DXF files."""
@@ -551,6 +663,241 @@ class TestIntegration:
             if os.path.exists(dxf_path):
                 os.unlink(dxf_path)
 
+    @pytest.mark.parametrize("body_raw", [None, "", " ", "\n\n", " " * 64, b"\r\n\t  "])
+    def test_main_rejects_empty_body_without_decoding(self, body_raw):
+        """Test empty and whitespace-only bodies get a 400 without reaching the decoder."""
+        import main as main_module
+        context = Mock()
+        context.req.body_raw = body_raw
+        with patch.object(main_module, "_json_loads") as json_loads, \
+                patch.object(main_module.logger, "error") as log_error:
+            main_module.main(context)
+        context.res.json.assert_called_once_with({"error": "Invalid JSON format"}, 400)
+        json_loads.assert_not_called()
+        log_error.assert_not_called()
+
+
+class TestAgentZeroHelpers:
+    """Test Agent Zero helper utilities."""
+    
+    @pytest.fixture
+    def helpers(self):
+        return AgentZeroHelpers()
+    
+    def _generated_json(self, helpers, dimensions):
+        return {
+            "template_name": helpers.available_templates[0],
+            "customization": {"dimensions": dimensions, "appliances": []},
+            "client_info": {"project_name": "Test Kitchen"}
+        }
+    
+    def test_validate_generated_json_valid(self, helpers):
+        """Test that well-formed generated JSON passes validation."""
+        is_valid, errors, _ = helpers.validate_generated_json(self._generated_json(helpers, [4000, 3000]))
+        assert is_valid
+        assert errors == []
+    
+    @staticmethod
+    def _reference_keyword_hits(helpers, text):
+        """Per-keyword substring scan the single-pass keyword matcher replaces."""
+        hits = set()
+        for kind in ("styles", "appliances", "layouts", "budget_indicators"):
+            for category, keywords in helpers.vocabulary.get(kind, {}).items():
+                for keyword in keywords:
+                    if keyword.lower() in text.lower():
+                        hits.add((kind, category))
+        return hits
+    
+    @pytest.mark.parametrize("text", [
+        "",
+        "no matching words here",
+        # Nested keywords: "microwave oven" contains "microwave", "micro" and "oven"
+        "we need a microwave oven",
+        # Keywords nested across kinds: style inside an appliance, stove inside range hood
+        "farmhouse sink and a cooking exhaust",
+        "minimalist kitchen island with good value finishes",
+        # Repeated keywords
+        "island island island with an oven and another oven",
+        # Mixed case
+        "Modern L-Shaped kitchen with a Microwave OVEN and LUXURY Dishwasher",
+        # Overlapping keywords sharing characters
+        "an open planner with rangehood and microwaveoven",
+    ])
+    def test_keyword_matching_matches_substring_scan(self, helpers, text):
+        """Test single-pass keyword matching reports the same hits as per-keyword scans."""
+        hits = helpers._match_vocabulary_keywords(text.lower())
+        expected = self._reference_keyword_hits(helpers, text)
+        assert hits == expected
+        assert len(hits) == len(expected)
+    
+    def test_extract_requirements_nested_keywords(self, helpers):
+        """Test requirement extraction from nested, repeated and mixed-case keywords."""
+        requirements = helpers.extract_requirements_from_text(
+            "Farmhouse SINK, microwave oven, Kitchen Island and another island")
+        assert requirements["style"] == "traditional"
+        assert requirements["appliances"] == ["island", "sink", "oven", "microwave"]
+    
+    def test_extract_requirements_cached_results_are_isolated(self, helpers):
+        """Test repeated extraction returns equal results that callers cannot corrupt."""
+        text = "Modern 4x3 meters kitchen with island and dishwasher, luxury, wheelchair accessible"
+        
+        first = helpers.extract_requirements_from_text(text)
+        second = helpers.extract_requirements_from_text(text)
+        assert first == second
+        assert first is not second
+        expected = {key: list(value) if isinstance(value, list) else value for key, value in first.items()}
+        
+        # Mutate every part of a returned result
+        first["appliances"].append("oven")
+        first["dimensions"][0] = 1
+        first["special_requirements"].clear()
+        first["style"] = "industrial"
+        first["extra"] = True
+        
+        third = helpers.extract_requirements_from_text(text)
+        assert third == expected
+        assert third == second
+    
+    def test_extract_requirements_cache_is_bounded(self, helpers):
+        """Test the extraction cache evicts old entries beyond its size limit."""
+        import agent_zero_helpers
+        
+        limit = agent_zero_helpers._EXTRACT_CACHE_SIZE
+        for i in range(limit + 10):
+            helpers.extract_requirements_from_text(f"kitchen number {i}")
+        assert len(helpers._extract_cache) == limit
+        assert "kitchen number 0" not in helpers._extract_cache
+        assert helpers.extract_requirements_from_text("kitchen number 0")["style"] == "modern"
+    
+    @pytest.mark.parametrize("bad_value", [float("nan"), float("inf"), -float("inf")])
+    def test_validate_generated_json_non_finite_dimensions(self, helpers, bad_value):
+        """Test that NaN and infinite dimensions are rejected."""
+        for dimensions in ([bad_value, 3000], [4000, bad_value]):
+            is_valid, errors, _ = helpers.validate_generated_json(self._generated_json(helpers, dimensions))
+            assert not is_valid
+            assert "Dimensions must be positive numbers" in errors
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Moderne Küche", "modern kitchen"),
+        ("moderne kueche", "modern kitchen"),
+        ("Große Küche", "large kitchen"),
+        ("grosse Kuche", "grosse kuche"),
+        ("L-förmige Küche", "l-shaped kitchen"),
+        ("Große Küche, größer als Straße", "large kitchen, größer als straße"),
+        ("Kühlschrank und Spülmaschine", "kühlschrank und spülmaschine"),
+    ])
+    def test_translate_german_terms_keeps_untranslated_words(self, helpers, text, expected):
+        """Test both spellings translate while untranslated words keep their umlauts."""
+        assert helpers.translate_german_terms(text) == expected
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Moderne Küche mit Insel", "moderne kitchen with island"),
+        ("kleine küche mit insel", "kleine kitchen with island"),
+        ("Offene Kueche mit Insel", "offene kitchen with island"),
+        ("L-förmige Küche mit Insel und Herd", "l-förmige kitchen with island und herd"),
+        ("moderne küche und kleine küche", "modern kitchen und small kitchen"),
+    ])
+    def test_translate_german_terms_overlapping_phrases(self, helpers, text, expected):
+        """Test overlapping phrases resolve like the sequential phrase replacement."""
+        assert helpers.translate_german_terms(text) == expected
+
+    def test_extract_requirements_german_island(self, helpers):
+        """Test the island in an overlapping German phrase is still found."""
+        requirements = helpers.extract_requirements_from_text("Moderne Küche mit Insel 4x3 Meter")
+        assert requirements["appliances"] == ["island"]
+
+
+class TestKitchenTemplateEngine:
+    """Test kitchen template engine scoring and customization."""
+    
+    @pytest.fixture
+    def engine(self):
+        return KitchenTemplateEngine()
+    
+    @staticmethod
+    def _reference_score(template, dimensions, style, appliances):
+        """Scalar per-template score that _score_templates vectorizes."""
+        score = 0.0
+        rec_dims = template.get("parameters", {}).get("recommended_dimensions", [])
+        if dimensions and rec_dims and len(dimensions) >= 2 and len(rec_dims) >= 2:
+            width_diff = abs(dimensions[0] - rec_dims[0]) / rec_dims[0]
+            height_diff = abs(dimensions[1] - rec_dims[1]) / rec_dims[1]
+            score += max(0, 1 - (width_diff + height_diff) / 2) * 0.4
+        
+        template_style = template.get("style", "").lower()
+        if style and template_style == style:
+            score += 0.3
+        elif style and style in template_style:
+            score += 0.15
+        
+        requested_appliances = set(appliances)
+        if requested_appliances:
+            overlap = len(set(template.get("appliances_included", [])) & requested_appliances)
+            score += overlap / len(requested_appliances) * 0.3
+        
+        return min(score, 1.0)
+    
+    @pytest.mark.parametrize("dimensions,style,appliances", [
+        ([], "", []),
+        ([4000, 3000], "", []),
+        ([2400, 1800], "modern", ["island", "dishwasher"]),
+        ([6000], "tradition", ["oven"]),
+        ([12000, 9000], "country", ["unknown_appliance", "refrigerator", "refrigerator"]),
+        ([4500, 3500], "industrial", ["sink", "stove", "refrigerator", "dishwasher", "microwave"]),
+    ])
+    def test_score_templates_matches_reference(self, engine, dimensions, style, appliances):
+        """Test vectorized template scores against the scalar scoring rules."""
+        scores = engine._score_templates(dimensions, style, appliances)
+        
+        assert len(scores) == len(engine.list_templates())
+        for name, score in zip(engine._template_names, scores):
+            expected = self._reference_score(engine._template_meta[name], dimensions, style, appliances)
+            assert score == pytest.approx(expected)
+    
+    def test_customize_template_does_not_mutate_template(self, engine):
+        """Test customization returns a new template and leaves the input unchanged."""
+        import copy
+        
+        template = engine.get_template("modern_l_shaped")
+        original = copy.deepcopy(template)
+        
+        customized = engine.customize_template(template, {
+            "dimensions": [5000, 3500],
+            "style": "industrial",
+            "appliances": ["oven", "wine_cooler"]
+        })
+        
+        assert template == original
+        assert engine.get_template("modern_l_shaped") == original
+        
+        assert customized is not template
+        assert customized["appliances_included"] == original["appliances_included"] + ["oven", "wine_cooler"]
+        walls = customized["dxf_template"]["figures"][0]
+        assert walls["points"] == [[0, 0], [5000, 0], [5000, 3500], [0, 3500]]
+        layer_colors = {layer["name"]: layer["color"] for layer in customized["dxf_template"]["layers"]}
+        assert layer_colors["Cabinets"] == 8
+        assert layer_colors["Appliances"] == 9
+    
+    def test_customize_template_without_changes_returns_copy(self, engine):
+        """Test an empty customization still returns a dict separate from the input."""
+        template = engine.get_template("compact_galley")
+        customized = engine.customize_template(template, {})
+        
+        assert customized == template
+        assert customized is not template
+    
+    def test_templates_property(self, engine):
+        """Test the templates mapping matches get_template and cannot alter it."""
+        templates = engine.templates
+        assert list(templates) == engine.list_templates()
+        for name, template in templates.items():
+            assert template == engine.get_template(name)
+        
+        templates["compact_galley"]["dxf_template"].clear()
+        assert engine.get_template("compact_galley")["dxf_template"]
+        with pytest.raises(AttributeError):
+            engine.templates = {}
+
 
 # Pytest configuration and test runner
 if __name__ == "__main__":